@@ -14,13 +14,13 @@ from __future__ import annotations
 import os
 import re
 import shutil
-import subprocess
-import sys
 from pathlib import Path
 
 import rdflib
 from rdflib import OWL, RDF, Namespace, URIRef
 
+from omb.utils import class_page_generator, properties_updater
+
 PAV = Namespace("http://purl.org/pav/")
 
 ROOT_DIR = Path(__file__).parent.parent.resolve()
@@ -71,6 +71,21 @@ def _extract_version_info(owl_file: Path) -> str:
     return "unknown"
 
 
+def _scan_entries(directory: Path, want_dirs: bool) -> list[Path]:
+    """
+    List the sub-directories (or regular files) of a directory, sorted by name.
+
+    Uses os.scandir so the entry type comes from the directory read itself
+    instead of one stat() call per entry.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if (entry.is_dir() if want_dirs else entry.is_file())
+        )
+
+
 def _find_instance_file(domain: str) -> Path | None:
     valid_dir = TESTS_DATA_DIR / domain / "valid"
     if not valid_dir.exists():
@@ -109,14 +124,11 @@ def _copy_domain_artifacts(domain_dir: Path) -> None:
         "VERSIONING.md",  # Versioning documentation (repository-level)
     }
 
-    for file_path in sorted(domain_dir.iterdir()):
-        if file_path.is_file():
-            # Check if file should be excluded
-            should_exclude = any(
-                file_path.match(pattern) for pattern in exclude_patterns
-            )
-            if not should_exclude:
-                shutil.copy2(file_path, target_dir / file_path.name)
+    for file_path in _scan_entries(domain_dir, want_dirs=False):
+        # Check if file should be excluded
+        should_exclude = any(file_path.match(pattern) for pattern in exclude_patterns)
+        if not should_exclude:
+            shutil.copy2(file_path, target_dir / file_path.name)
 
     instance_file = _find_instance_file(domain)
     if instance_file:
@@ -128,9 +140,11 @@ def _run_docs_generators() -> None:
     Run documentation generators before building docs.
 
     DOCS_SITE_URL is optional and overrides the base URL used for local diagrams.
+    The generators run in-process so rdflib is imported and initialised once
+    for the whole build instead of once per generator subprocess.
     """
-    subprocess.run([sys.executable, "-m", "omb.utils.properties_updater"], check=True)
-    subprocess.run([sys.executable, "-m", "omb.utils.class_page_generator"], check=True)
+    properties_updater.generate_all()
+    class_page_generator.generate_all_class_pages()
 
 
 def _build_class_page_nav(docs_dir: Path) -> dict:
@@ -145,10 +159,7 @@ def _build_class_page_nav(docs_dir: Path) -> dict:
         return {}
 
     domain_nav: dict = {}
-    for domain_dir in sorted(classes_root.iterdir()):
-        if not domain_dir.is_dir():
-            continue
-
+    for domain_dir in _scan_entries(classes_root, want_dirs=True):
         class_files = sorted(
             [p for p in domain_dir.glob("*.md") if p.name != "index.md"]
         )
@@ -233,9 +244,7 @@ def on_pre_build(config, **kwargs):
         shutil.rmtree(DOCS_ARTIFACTS_DIR)
     DOCS_ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    for domain_dir in sorted(ARTIFACTS_DIR.iterdir()):
-        if not domain_dir.is_dir():
-            continue
+    for domain_dir in _scan_entries(ARTIFACTS_DIR, want_dirs=True):
         _copy_domain_artifacts(domain_dir)
 
 
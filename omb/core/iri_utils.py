@@ -50,9 +50,14 @@ NOTES:
 import argparse
 import re
 import sys
+from functools import lru_cache
 from typing import Dict, Optional
 from urllib.parse import unquote
 
+# Ontology IRI patterns used by iri_to_domain_hint: .../domain/vN/ and a bare vN
+_VERSIONED_IRI_RE = re.compile(r"/([^/]+)/v\d+/?$")
+_VERSION_SEGMENT_RE = re.compile(r"^v\d+$")
+
 
 def get_local_name(uri: str, lowercase: bool = False) -> str:
     """
@@ -284,11 +289,13 @@ def normalize_iri(iri: str, trailing_slash: bool = True) -> str:
         return iri.rstrip("/")
 
 
+@lru_cache(maxsize=256)
 def iri_to_domain_hint(iri: str) -> Optional[str]:
     """
     Extract a domain hint from an ontology IRI.
 
     Attempts to find the domain name from typical ontology IRI patterns.
+    Results are cached, since the same ontology IRIs recur across domains.
 
     Args:
         iri: Ontology IRI
@@ -307,7 +314,7 @@ def iri_to_domain_hint(iri: str) -> Optional[str]:
 
     # Pattern: .../domain/vN/ or .../domain/
     # Match version pattern
-    version_match = re.search(r"/([^/]+)/v\d+/?$", iri)
+    version_match = _VERSIONED_IRI_RE.search(iri)
     if version_match:
         return version_match.group(1)
 
@@ -316,7 +323,7 @@ def iri_to_domain_hint(iri: str) -> Optional[str]:
     if parts:
         last = parts[-1]
         # Skip version numbers
-        if not re.match(r"^v\d+$", last):
+        if not _VERSION_SEGMENT_RE.match(last):
             return last
 
     return None
@@ -38,6 +38,7 @@ from .file_collector import (
     collect_ontology_files,
     collect_test_files,
     collect_turtle_files,
+    iter_files_by_extension,
     normalize_paths_to_list,
     write_if_changed,
 )
@@ -67,6 +68,7 @@ __all__ = [
     "collect_ontology_files",
     "collect_test_files",
     "collect_turtle_files",
+    "iter_files_by_extension",
     "write_if_changed",
     # Graph loading
     "FAST_STORE",
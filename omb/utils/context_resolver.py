@@ -8,11 +8,14 @@ parsing, avoiding any network access for known contexts.
 """
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from omb.core.iri_utils import iri_variants
 from omb.core.logging import get_logger
+from omb.utils.file_collector import iter_files_by_extension
 
 logger = get_logger(__name__)
 
@@ -24,6 +27,30 @@ DEFAULT_URI_TWEAKS: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _uri_tweak_pattern(olds: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile one alternation matching any tweak source, longest first."""
+    return re.compile(
+        "|".join(re.escape(old) for old in sorted(olds, key=len, reverse=True))
+    )
+
+
+def _apply_uri_tweaks(text: str, uri_tweaks: Dict[str, str]) -> str:
+    """Apply ``uri_tweaks`` replacements to ``text`` in a single scan.
+
+    A lone tweak is a plain ``str.replace``; several are matched by one
+    compiled alternation instead of one full pass over ``text`` per tweak.
+    Replacements are not re-scanned, so tweaks do not chain.
+    """
+    if not uri_tweaks:
+        return text
+    if len(uri_tweaks) == 1:
+        ((old, new),) = uri_tweaks.items()
+        return text.replace(old, new)
+    pattern = _uri_tweak_pattern(tuple(uri_tweaks))
+    return pattern.sub(lambda m: uri_tweaks[m.group(0)], text)
+
+
 def _add_url_variants(url_map: Dict[str, Path], iri: str, abs_path: Path) -> None:
     """Add URL variants for an IRI to the URL map.
 
@@ -89,7 +116,14 @@ def discover_context_files(
     for artifacts_dir in artifact_dirs:
         if not artifacts_dir.is_dir():
             continue
-        for ctx_file in artifacts_dir.rglob("*.context.jsonld"):
+        # Same walk and pruning policy as every other file collection
+        # (version control, virtualenv and cache dirs); other dot-directories
+        # such as .well-known/ are still searched
+        for ctx_file in iter_files_by_extension(
+            artifacts_dir, ".jsonld", warn_on_invalid=False, return_pathlib=True
+        ):
+            if not ctx_file.name.endswith(".context.jsonld"):
+                continue
             try:
                 with open(ctx_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -110,9 +144,7 @@ def discover_context_files(
                     _add_url_variants(url_map, vocab, abs_path)
                     # Also map the tweaked variant (e.g. # -> /)
                     if uri_tweaks:
-                        tweaked = vocab
-                        for old, new in uri_tweaks.items():
-                            tweaked = tweaked.replace(old, new)
+                        tweaked = _apply_uri_tweaks(vocab, uri_tweaks)
                         if tweaked != vocab:
                             _add_url_variants(url_map, tweaked, abs_path)
                     logger.debug("Discovered context: %s -> %s", vocab, abs_path)
@@ -122,12 +154,28 @@ def discover_context_files(
 
 
 def _load_and_tweak_context(local_path: Path, uri_tweaks: Dict[str, str]) -> dict:
-    """Load a context file and apply URI tweaks to its serialised content."""
-    with open(local_path, "r", encoding="utf-8") as f:
+    """Load a context file and apply URI tweaks to its serialised content.
+
+    Memoized per file version and tweak set, since one document can refer to
+    the same context many times. The returned object is shared between
+    callers: it is only ever embedded into data that is serialized again,
+    never mutated.
+    """
+    return _load_and_tweak_context_cached(
+        str(local_path),
+        local_path.stat().st_mtime_ns,
+        tuple(uri_tweaks.items()),
+    )
+
+
+@lru_cache(maxsize=128)
+def _load_and_tweak_context_cached(
+    path_str: str, mtime_ns: int, tweaks_key: Tuple[Tuple[str, str], ...]
+) -> dict:
+    """Cached body of :func:`_load_and_tweak_context`; ``mtime_ns`` keys reloads."""
+    with open(path_str, "r", encoding="utf-8") as f:
         raw = f.read()
-    for old, new in uri_tweaks.items():
-        raw = raw.replace(old, new)
-    data = json.loads(raw)
+    data = json.loads(_apply_uri_tweaks(raw, dict(tweaks_key)))
     # Return just the @context value, not the wrapper
     ctx = data.get("@context", data)
     return ctx
@@ -137,18 +185,29 @@ def _inline_context_value(
     value: Union[str, list, dict],
     url_map: Dict[str, Path],
     uri_tweaks: Dict[str, str],
+    resolved: Dict[str, Union[str, dict]],
 ) -> Union[str, list, dict]:
-    """Replace a context URL with the inlined context object content."""
+    """Replace a context URL with the inlined context object content.
+
+    ``resolved`` remembers each URL's outcome for the current document, so a
+    URL repeated on many embedded nodes is looked up and stat-ed only once.
+    """
     if isinstance(value, str):
+        if value in resolved:
+            return resolved[value]
+        result: Union[str, dict] = value
         local_path = url_map.get(value) or url_map.get(value.rstrip("/"))
         if local_path and local_path.exists():
             logger.debug("Inlining context: %s from %s", value, local_path)
-            return _load_and_tweak_context(local_path, uri_tweaks)
-        return value
+            result = _load_and_tweak_context(local_path, uri_tweaks)
+        resolved[value] = result
+        return result
     elif isinstance(value, list):
-        return [_inline_context_value(item, url_map, uri_tweaks) for item in value]
+        return [
+            _inline_context_value(item, url_map, uri_tweaks, resolved) for item in value
+        ]
     elif isinstance(value, dict):
-        return _inline_contexts_recursive(value, url_map, uri_tweaks)
+        return _inline_contexts_recursive(value, url_map, uri_tweaks, resolved)
     return value
 
 
@@ -156,19 +215,76 @@ def _inline_contexts_recursive(
     data: Union[dict, list],
     url_map: Dict[str, Path],
     uri_tweaks: Dict[str, str],
+    resolved: Optional[Dict[str, Union[str, dict]]] = None,
 ) -> Union[dict, list]:
-    """Recursively walk JSON-LD and inline @context URL references."""
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if key == "@context":
-                result[key] = _inline_context_value(value, url_map, uri_tweaks)
-            else:
-                result[key] = _inline_contexts_recursive(value, url_map, uri_tweaks)
-        return result
-    elif isinstance(data, list):
-        return [_inline_contexts_recursive(item, url_map, uri_tweaks) for item in data]
-    return data
+    """Walk JSON-LD and return a copy with @context URL references inlined.
+
+    Uses an explicit stack of (source, copy) container pairs instead of
+    recursion, so deeply nested documents cost no Python call per node and
+    cannot hit the recursion limit.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    if resolved is None:
+        resolved = {}
+
+    root: Union[dict, list] = {} if isinstance(data, dict) else []
+    stack = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if key == "@context":
+                    target[key] = _inline_context_value(
+                        value, url_map, uri_tweaks, resolved
+                    )
+                elif isinstance(value, dict):
+                    target[key] = copied = {}
+                    stack.append((value, copied))
+                elif isinstance(value, list):
+                    target[key] = copied = []
+                    stack.append((value, copied))
+                else:
+                    target[key] = value
+        else:
+            for item in source:
+                if isinstance(item, dict):
+                    copied = {}
+                elif isinstance(item, list):
+                    copied = []
+                else:
+                    target.append(item)
+                    continue
+                target.append(copied)
+                stack.append((item, copied))
+    return root
+
+
+def _inline_contexts_in_place(
+    data: Union[dict, list],
+    url_map: Dict[str, Path],
+    uri_tweaks: Dict[str, str],
+) -> None:
+    """Inline @context URL references into ``data`` itself.
+
+    For documents nobody else holds a reference to: only the @context values
+    are replaced, so the tree is not duplicated the way
+    :func:`_inline_contexts_recursive` must for caller-owned data.
+    """
+    resolved: Dict[str, Union[str, dict]] = {}
+    stack: List[Union[dict, list]] = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "@context":
+                    node[key] = _inline_context_value(
+                        value, url_map, uri_tweaks, resolved
+                    )
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
 
 
 def _collect_unresolved_context_urls(
@@ -178,16 +294,17 @@ def _collect_unresolved_context_urls(
     """Collect remote @context URLs that could not be inlined locally."""
     unresolved: set[str] = set()
 
-    def _walk(node: Union[dict, list, str], in_context: bool = False) -> None:
+    # Explicit stack of (node, inside-@context) pairs instead of recursion
+    stack: List[Tuple[Union[dict, list, str], bool]] = [(data, False)]
+    while stack:
+        node, in_context = stack.pop()
         if isinstance(node, dict):
             for key, value in node.items():
-                _walk(value, in_context=(key == "@context"))
-            return
-        if isinstance(node, list):
+                stack.append((value, key == "@context"))
+        elif isinstance(node, list):
             for item in node:
-                _walk(item, in_context=in_context)
-            return
-        if (
+                stack.append((item, in_context))
+        elif (
             isinstance(node, str)
             and in_context
             and node.startswith(("http://", "https://"))
@@ -195,7 +312,6 @@ def _collect_unresolved_context_urls(
             if not (url_map.get(node) or url_map.get(node.rstrip("/"))):
                 unresolved.add(node)
 
-    _walk(data)
     return sorted(unresolved)
 
 
@@ -222,7 +338,25 @@ def inline_jsonld_with_local_contexts(
 
     if url_map:
         data = _inline_contexts_recursive(data, url_map, uri_tweaks)
-        unresolved = _collect_unresolved_context_urls(data, url_map)
+    return _serialize_inlined(data, url_map, uri_tweaks, source_name)
+
+
+def _serialize_inlined(
+    data: Union[dict, list],
+    url_map: Optional[Dict[str, Path]],
+    uri_tweaks: Dict[str, str],
+    source_name: Optional[Union[str, Path]],
+    context_scope: Optional[Union[dict, list]] = None,
+) -> str:
+    """Warn about contexts left remote and serialize with URI tweaks applied.
+
+    ``context_scope`` is the part of ``data`` holding every @context, when the
+    caller knows it is smaller than the whole document.
+    """
+    if url_map:
+        unresolved = _collect_unresolved_context_urls(
+            data if context_scope is None else context_scope, url_map
+        )
         if unresolved:
             logger.warning(
                 "Unresolved @context URL(s) in %s (rdflib will fetch remotely): %s",
@@ -230,12 +364,7 @@ def inline_jsonld_with_local_contexts(
                 ", ".join(unresolved),
             )
 
-    result = json.dumps(data)
-
-    for old, new in uri_tweaks.items():
-        result = result.replace(old, new)
-
-    return result
+    return _apply_uri_tweaks(json.dumps(data), uri_tweaks)
 
 
 def load_jsonld_with_local_contexts(
@@ -263,11 +392,24 @@ def load_jsonld_with_local_contexts(
         uri_tweaks = DEFAULT_URI_TWEAKS
 
     with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        raw = f.read()
+    data = json.loads(raw)
 
-    return inline_jsonld_with_local_contexts(
-        data,
-        url_map,
-        uri_tweaks=uri_tweaks,
-        source_name=file_path,
-    )
+    if not url_map:
+        return _serialize_inlined(data, url_map, uri_tweaks, file_path)
+
+    # Most instances only carry the top-level @context. When the raw text
+    # mentions the key just once, that is the only one to inline and check,
+    # and neither tree walk is needed.
+    if raw.count('"@context"') == 1 and isinstance(data, dict) and "@context" in data:
+        data["@context"] = _inline_context_value(
+            data["@context"], url_map, uri_tweaks, {}
+        )
+        return _serialize_inlined(
+            data, url_map, uri_tweaks, file_path, {"@context": data["@context"]}
+        )
+
+    # The decoded tree is private to this call, so inline in place instead of
+    # holding a second copy of the whole document while serializing.
+    _inline_contexts_in_place(data, url_map, uri_tweaks)
+    return _serialize_inlined(data, url_map, uri_tweaks, file_path)
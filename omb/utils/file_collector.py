@@ -6,6 +6,7 @@ FEATURE SET:
 ============
 1. normalize_paths_to_list - Convert single path or list to list of strings
 2. collect_files_by_extension - Generic extension-based file collection
+   iter_files_by_extension - Same walk, yielding files lazily
 3. collect_turtle_files - Collect all .ttl files from paths
 4. collect_jsonld_files - Collect all .json/.jsonld files from paths
 5. collect_ontology_bundles - Discover complete ontology bundles
@@ -43,7 +44,8 @@ STANDALONE TESTING:
 
 DEPENDENCIES:
 =============
-- pathlib: For path operations (stdlib)
+- pathlib, os: For path operations and directory scanning (stdlib)
+- concurrent.futures: Optional threaded IRI extraction (stdlib)
 - No external dependencies - this module is intentionally pure
 
 NOTES:
@@ -54,9 +56,12 @@ NOTES:
 """
 
 import argparse
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import AbstractSet, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 # Type alias for flexible path input (single or multiple)
 PathsInput = Union[str, Path, List[Union[str, Path]]]
@@ -86,48 +91,123 @@ def normalize_paths_to_list(paths: PathsInput) -> List[str]:
     """
     if isinstance(paths, (str, Path)):
         return [str(paths)]
-    return [str(p) for p in paths]
+    # Exact strings pass through; str() is only needed for Path-like entries
+    return [p if type(p) is str else str(p) for p in paths]
+
+
+#: Directory names the recursive walk never descends into: version control,
+#: virtual environments and tool caches. Dot directories in general are still
+#: walked, since did:web documents live under ``.well-known/``.
+_PRUNED_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        ".tox",
+        ".mypy_cache",
+        "node_modules",
+        "__pycache__",
+    }
+)
 
 
-def collect_files_by_extension(
+def _scan_dir(
+    directory: str, prune_dirs: AbstractSet[str]
+) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    List one directory as (non-directory entries, subdirectory paths).
+
+    Symlinked directories count as entries, not subdirectories, and an
+    unreadable directory lists as empty, as with ``Path.rglob``.
+    Subdirectories named in ``prune_dirs`` are left out.
+    """
+    entries: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in prune_dirs:
+                        subdirs.append(entry.path)
+                else:
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries, subdirs
+
+
+def _list_names(directory: Path) -> List[str]:
+    """
+    List the entry names of one directory, in ``os.scandir`` order.
+
+    A missing or unreadable directory lists as empty, as with ``Path.glob``.
+    """
+    try:
+        with os.scandir(directory) as scanner:
+            return [entry.name for entry in scanner]
+    except OSError:
+        return []
+
+
+def _iter_file_entries(
+    root: str, prune_dirs: AbstractSet[str] = _PRUNED_DIR_NAMES
+) -> Iterator[os.DirEntry]:
+    """
+    Yield the non-directory entries below a directory, in ``Path.rglob`` order.
+
+    ``rglob("*")`` walks directories depth-first and lists the children of
+    each walked directory as a batch; the same order is reproduced here with
+    one ``os.scandir`` per directory. Entries carry their type from the
+    directory read, so no per-entry ``stat`` or ``Path`` is needed.
+
+    Args:
+        root: Directory to walk
+        prune_dirs: Subdirectory names not to descend into
+
+    Yields:
+        ``os.DirEntry`` for every entry that is not a real directory
+    """
+    entries, subdirs = _scan_dir(root, prune_dirs)
+    yield from entries
+    children: Dict[str, List[str]] = {root: subdirs}
+    walk = [root]
+    while walk:
+        directory = walk.pop()
+        kids = children.pop(directory)
+        for kid in kids:
+            entries, children[kid] = _scan_dir(kid, prune_dirs)
+            yield from entries
+        walk.extend(reversed(kids))
+
+
+def iter_files_by_extension(
     paths: PathsInput,
     extensions: Union[str, Set[str]],
     warn_on_invalid: bool = True,
     return_pathlib: bool = False,
-    sort_and_deduplicate: bool = False,
-) -> List[Union[str, Path]]:
+    prune_dirs: Optional[Set[str]] = None,
+) -> Iterator[Union[str, Path]]:
     """
-    Collect all files with specified extensions from the given paths.
+    Yield files with specified extensions from the given paths as they are found.
 
-    This function walks through directories recursively and collects files
-    matching the specified extensions. It can handle a single file/directory
-    or a list of files/directories.
+    Same inputs, matching and order as ``collect_files_by_extension`` without
+    sorting, but nothing is buffered: callers can start work while the walk
+    is still running, and stopping early (e.g. "is there any .ttl file?")
+    skips the rest of the scan.
 
     Args:
         paths: Single path or list of file/directory paths to search
         extensions: File extension(s) to collect (e.g., ".ttl" or {".json", ".jsonld"})
                     Extensions should include the dot prefix
         warn_on_invalid: If True, write warnings to stderr for invalid paths
-        return_pathlib: If True, return Path objects; if False, return strings
-        sort_and_deduplicate: If True, sort and remove duplicates from results
-
-    Returns:
-        List of file paths matching the specified extensions
-
-    Examples:
-        # Single file
-        files = collect_files_by_extension("data/file.ttl", ".ttl")
-
-        # Single directory
-        files = collect_files_by_extension("artifacts/", ".ttl")
+        return_pathlib: If True, yield Path objects; if False, yield strings
+        prune_dirs: Directory names not to descend into while walking
+                    (default: version control, virtualenv and cache dirs;
+                    pass an empty set to walk everything)
 
-        # Multiple paths
-        files = collect_files_by_extension(
-            ["data/", "examples/"],
-            {".json", ".jsonld"},
-            return_pathlib=True,
-            sort_and_deduplicate=True
-        )
+    Yields:
+        File paths matching the specified extensions, in walk order
     """
     # Normalize paths to list
     path_list = normalize_paths_to_list(paths)
@@ -140,8 +220,11 @@ def collect_files_by_extension(
 
     # Ensure all extensions start with a dot
     ext_set = {ext if ext.startswith(".") else f".{ext}" for ext in ext_set}
+    # One C-level endswith rejects most names before the exact suffix check
+    ext_tuple = tuple(ext_set)
 
-    files = []
+    if prune_dirs is None:
+        prune_dirs = _PRUNED_DIR_NAMES
 
     for path_input in path_list:
         path = Path(path_input).resolve()
@@ -149,24 +232,90 @@ def collect_files_by_extension(
         if path.is_file():
             # Check if file has the right extension
             if path.suffix in ext_set:
-                files.append(path if return_pathlib else str(path))
+                yield path if return_pathlib else str(path)
             elif warn_on_invalid:
                 sys.stderr.write(
                     f"Warning: Ignoring file with wrong extension: {path}\n"
                 )
         elif path.is_dir():
-            # Walk directory recursively
-            for file_path in path.rglob("*"):
-                if file_path.is_file() and file_path.suffix in ext_set:
-                    files.append(file_path if return_pathlib else str(file_path))
+            # Walk directory recursively; the extension is checked on the
+            # entry name so only matching files become paths
+            for entry in _iter_file_entries(str(path), prune_dirs):
+                name = entry.name
+                if not name.endswith(ext_tuple):
+                    continue
+                # Same rule as Path.suffix: the text from the last dot on,
+                # where a leading dot alone does not start a suffix
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:] in ext_set and entry.is_file():
+                    yield Path(entry.path) if return_pathlib else entry.path
         elif warn_on_invalid:
             sys.stderr.write(
                 f"Warning: Ignoring invalid path or unsupported file: {path}\n"
             )
 
-    # Sort and deduplicate if requested
+
+def collect_files_by_extension(
+    paths: PathsInput,
+    extensions: Union[str, Set[str]],
+    warn_on_invalid: bool = True,
+    return_pathlib: bool = False,
+    sort_and_deduplicate: bool = False,
+    prune_dirs: Optional[Set[str]] = None,
+) -> List[Union[str, Path]]:
+    """
+    Collect all files with specified extensions from the given paths.
+
+    This function walks through directories recursively and collects files
+    matching the specified extensions. It can handle a single file/directory
+    or a list of files/directories. Use ``iter_files_by_extension`` to
+    consume the results while the walk is running.
+
+    Args:
+        paths: Single path or list of file/directory paths to search
+        extensions: File extension(s) to collect (e.g., ".ttl" or {".json", ".jsonld"})
+                    Extensions should include the dot prefix
+        warn_on_invalid: If True, write warnings to stderr for invalid paths
+        return_pathlib: If True, return Path objects; if False, return strings
+        sort_and_deduplicate: If True, sort and remove duplicates from results
+        prune_dirs: Directory names not to descend into while walking
+                    (default: version control, virtualenv and cache dirs;
+                    pass an empty set to walk everything)
+
+    Returns:
+        List of file paths matching the specified extensions
+
+    Examples:
+        # Single file
+        files = collect_files_by_extension("data/file.ttl", ".ttl")
+
+        # Single directory
+        files = collect_files_by_extension("artifacts/", ".ttl")
+
+        # Multiple paths
+        files = collect_files_by_extension(
+            ["data/", "examples/"],
+            {".json", ".jsonld"},
+            return_pathlib=True,
+            sort_and_deduplicate=True
+        )
+    """
+    files = list(
+        iter_files_by_extension(
+            paths,
+            extensions,
+            warn_on_invalid=warn_on_invalid,
+            return_pathlib=return_pathlib,
+            prune_dirs=prune_dirs,
+        )
+    )
+
+    # Sort and deduplicate if requested. Deduplicating in walk order keeps the
+    # per-directory runs intact, which the sort then merges far faster than
+    # the scrambled order a set would hand it.
     if sort_and_deduplicate:
-        files = sorted(set(files))
+        files = list(dict.fromkeys(files))
+        files.sort()
 
     return files
 
@@ -175,6 +324,7 @@ def collect_turtle_files(
     paths: PathsInput,
     warn_on_invalid: bool = True,
     return_pathlib: bool = False,
+    prune_dirs: Optional[Set[str]] = None,
 ) -> List[Union[str, Path]]:
     """
     Collect all Turtle (.ttl) files from the given paths.
@@ -183,12 +333,17 @@ def collect_turtle_files(
         paths: Single path or list of file/directory paths to search
         warn_on_invalid: If True, write warnings to stderr for invalid paths
         return_pathlib: If True, return Path objects; if False, return strings
+        prune_dirs: Directory names not to descend into (default: VCS/cache dirs)
 
     Returns:
         List of Turtle file paths
     """
     return collect_files_by_extension(
-        paths, ".ttl", warn_on_invalid=warn_on_invalid, return_pathlib=return_pathlib
+        paths,
+        ".ttl",
+        warn_on_invalid=warn_on_invalid,
+        return_pathlib=return_pathlib,
+        prune_dirs=prune_dirs,
     )
 
 
@@ -197,6 +352,7 @@ def collect_jsonld_files(
     warn_on_invalid: bool = True,
     return_pathlib: bool = False,
     sort_and_deduplicate: bool = False,
+    prune_dirs: Optional[Set[str]] = None,
 ) -> List[Union[str, Path]]:
     """
     Collect all JSON-LD (.json, .jsonld) files from the given paths.
@@ -206,6 +362,7 @@ def collect_jsonld_files(
         warn_on_invalid: If True, write warnings to stderr for invalid paths
         return_pathlib: If True, return Path objects; if False, return strings
         sort_and_deduplicate: If True, sort and remove duplicates
+        prune_dirs: Directory names not to descend into (default: VCS/cache dirs)
 
     Returns:
         List of JSON-LD file paths
@@ -216,6 +373,7 @@ def collect_jsonld_files(
         warn_on_invalid=warn_on_invalid,
         return_pathlib=return_pathlib,
         sort_and_deduplicate=sort_and_deduplicate,
+        prune_dirs=prune_dirs,
     )
 
 
@@ -239,17 +397,28 @@ def collect_files_by_pattern(
     path_list = normalize_paths_to_list(paths)
     files = []
 
+    # A pattern without wildcards names one file; check it directly instead
+    # of running the glob machinery over the directory
+    is_literal = not any(ch in pattern for ch in "*?[")
+
     for path_input in path_list:
         path = Path(path_input).resolve()
 
         if path.is_dir():
+            if is_literal:
+                candidate = path / pattern
+                if candidate.is_file():
+                    files.append(candidate if return_pathlib else str(candidate))
+                continue
             for file_path in path.glob(pattern):
                 if file_path.is_file():
                     files.append(file_path if return_pathlib else str(file_path))
         elif path.is_file() and path.match(pattern):
             files.append(path if return_pathlib else str(path))
 
-    return sorted(set(files))
+    files = list(dict.fromkeys(files))
+    files.sort()
+    return files
 
 
 def collect_ontology_files(domain_dir: Path) -> Dict[str, Optional[Path]]:
@@ -268,18 +437,22 @@ def collect_ontology_files(domain_dir: Path) -> Dict[str, Optional[Path]]:
         Values are Path objects or None if not found
     """
     domain = domain_dir.name
+    # One directory read answers every lookup below
+    names = set(_list_names(domain_dir))
 
     # Standard file patterns
-    ontology_file = domain_dir / f"{domain}.owl.ttl"
-    context_file = domain_dir / f"{domain}.context.jsonld"
+    ontology_name = f"{domain}.owl.ttl"
+    context_name = f"{domain}.context.jsonld"
 
     # SHACL files can be multiple: domain.shacl.ttl and domain.*.shacl.ttl
-    shacl_files = sorted(domain_dir.glob("*.shacl.ttl"))
+    shacl_files = sorted(
+        domain_dir / name for name in names if name.endswith(".shacl.ttl")
+    )
 
     return {
-        "ontology": ontology_file if ontology_file.exists() else None,
+        "ontology": domain_dir / ontology_name if ontology_name in names else None,
         "shacl": shacl_files if shacl_files else None,
-        "context": context_file if context_file.exists() else None,
+        "context": domain_dir / context_name if context_name in names else None,
     }
 
 
@@ -352,57 +525,117 @@ def collect_ontology_bundles(
         return bundles
 
     # Iterate over domain directories
-    for ont_dir in sorted(base_dir.iterdir()):
-        if not ont_dir.is_dir():
-            continue
+    with os.scandir(base_dir) as it:
+        ont_dirs = sorted(Path(entry.path) for entry in it if entry.is_dir())
 
+    for ont_dir in ont_dirs:
         domain = ont_dir.name
+        owl_name = f"{domain}.owl.ttl"
+        jsonld_name = f"{domain}.context.jsonld"
 
+        # One directory read classifies every bundle file by name:
         # 1. Ontology File: {domain}.owl.ttl
-        owl_file = ont_dir / f"{domain}.owl.ttl"
-        if not owl_file.exists():
-            continue
-
         # 2. SHACL Files: *.shacl.ttl
-        shacl_files = sorted(ont_dir.glob("*.shacl.ttl"))
-
-        # 3. JSON-LD Context
-        jsonld_file = ont_dir / f"{domain}.context.jsonld"
-
-        # 4. Properties Documentation
-        properties_file = ont_dir / "PROPERTIES.md"
+        # 3. JSON-LD Context: {domain}.context.jsonld
+        # 4. Properties Documentation: PROPERTIES.md
+        owl_file: Optional[Path] = None
+        shacl_files: List[Path] = []
+        jsonld_file: Optional[Path] = None
+        properties_file: Optional[Path] = None
+        with os.scandir(ont_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name == owl_name:
+                    owl_file = ont_dir / name
+                elif name.endswith(".shacl.ttl"):
+                    shacl_files.append(ont_dir / name)
+                elif name == jsonld_name:
+                    jsonld_file = ont_dir / name
+                elif name == "PROPERTIES.md":
+                    properties_file = ont_dir / name
+
+        if owl_file is None:
+            continue
+        shacl_files.sort()
 
         # 5. Instance File (from tests directory if provided)
         instance_file = None
         if tests_dir and tests_dir.exists():
             valid_dir = tests_dir / domain / "valid"
-            if valid_dir.exists():
-                # Look for standard instance patterns
-                for pattern in [f"{domain}_instance.json", "*_instance.json"]:
-                    matches = list(valid_dir.glob(pattern))
-                    if matches:
-                        instance_file = matches[0]
-                        break
+            # Look for standard instance patterns: {domain}_instance.json,
+            # then the first *_instance.json in directory order
+            names = _list_names(valid_dir)
+            instance_name = f"{domain}_instance.json"
+            if instance_name not in names:
+                instance_name = next(
+                    (n for n in names if n.endswith("_instance.json")), None
+                )
+            if instance_name:
+                instance_file = valid_dir / instance_name
 
         bundles[domain] = {
             "ontology": owl_file.resolve(),
             "shacl": [f.resolve() for f in shacl_files] if shacl_files else None,
-            "jsonld": jsonld_file.resolve() if jsonld_file.exists() else None,
-            "properties": (
-                properties_file.resolve() if properties_file.exists() else None
-            ),
+            "jsonld": jsonld_file.resolve() if jsonld_file else None,
+            "properties": properties_file.resolve() if properties_file else None,
             "instance": instance_file.resolve() if instance_file else None,
         }
 
     return bundles
 
 
+#: Read size for streaming comparisons in write_if_changed.
+_COMPARE_CHUNK_SIZE = 65536
+
+
+def _stream_matches(path: Path, expected: bytes) -> bool:
+    """
+    Check whether a file's LF-normalized bytes equal ``expected``.
+
+    Reads the file in fixed-size chunks and stops at the first mismatch,
+    so large artifacts are never held in memory twice. A trailing CR is
+    carried into the next chunk so a CRLF split across chunks still
+    normalizes to one LF.
+
+    Args:
+        path: Existing file to compare
+        expected: LF-normalized UTF-8 bytes
+
+    Returns:
+        True if the normalized file content equals ``expected``
+    """
+    view = memoryview(expected)
+    pos = 0
+    carry = b""
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_COMPARE_CHUNK_SIZE), b""):
+            if carry:
+                chunk = carry + chunk
+            if chunk.endswith(b"\r"):
+                chunk, carry = chunk[:-1], b"\r"
+            else:
+                carry = b""
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            end = pos + len(chunk)
+            if view[pos:end] != chunk:
+                return False
+            pos = end
+    if carry:
+        if view[pos : pos + 1] != b"\n":
+            return False
+        pos += 1
+    return pos == len(expected)
+
+
 def write_if_changed(path: Path, content: str) -> bool:
     """
     Write content to file only if it differs from existing content.
 
     Uses LF line endings for cross-platform consistency.
     Normalizes line endings when comparing to avoid false positives.
+    The existing file is compared in 64 KiB chunks and the comparison
+    stops at the first difference; a file shorter than the new content
+    cannot match and is not read at all.
 
     Args:
         path: Target file path
@@ -413,24 +646,37 @@ def write_if_changed(path: Path, content: str) -> bool:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Normalize to LF for comparison
-    def normalize(s: str) -> str:
-        return s.replace("\r\n", "\n").replace("\r", "\n")
+    new_bytes = content.replace("\r\n", "\n").replace("\r", "\n").encode("utf-8")
 
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-        if normalize(existing) == normalize(content):
-            return False
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        size = None
 
-    with path.open("w", encoding="utf-8", newline="\n") as f:
-        f.write(content)
+    # Normalization only ever shrinks the file, so it can't match if smaller
+    if size is not None and size >= len(new_bytes) and _stream_matches(path, new_bytes):
+        return False
+
+    path.write_bytes(new_bytes)
     return True
 
 
+#: extract_jsonld_iris results keyed by path, stored with the file version
+#: (st_mtime_ns, st_size) they were parsed from.
+#:
+#: Repeated discovery in one process (API calls, validation reruns) would
+#: otherwise re-parse unchanged files. An edited file replaces its entry
+#: rather than adding one, so the cache holds at most one result per path.
+_IRI_CACHE: Dict[str, Tuple[int, int, Optional[str], frozenset]] = {}
+
+
 def extract_jsonld_iris(file_path: Path) -> tuple:
     """
     Extract root @id and all referenced IRIs from a JSON-LD file.
 
+    Results are memoized per path and reused while the file's modification
+    time and size are unchanged.
+
     Args:
         file_path: Path to JSON-LD file
 
@@ -439,35 +685,81 @@ def extract_jsonld_iris(file_path: Path) -> tuple:
         - root_id: The @id value of the document, or None
         - referenced_iris: Set of IRIs referenced in nested objects
     """
-    import json as _json
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None, set()
+
+    key = os.fspath(file_path)
+    cached = _IRI_CACHE.get(key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        root_id, referenced = _parse_jsonld_iris(file_path)
+        cached = _IRI_CACHE[key] = (
+            st.st_mtime_ns,
+            st.st_size,
+            root_id,
+            frozenset(referenced),
+        )
+    # A fresh set, so callers cannot alter the cached result
+    return cached[2], set(cached[3])
+
 
+def _parse_jsonld_iris(file_path: Path) -> Tuple[Optional[str], Set[str]]:
+    """Parse a JSON-LD file and collect its root @id and referenced IRIs."""
     try:
-        with file_path.open("r", encoding="utf-8") as f:
-            doc = _json.load(f)
+        # json decodes the raw bytes itself, skipping the text-mode wrapper
+        doc = json.loads(file_path.read_bytes())
     except Exception:
         return None, set()
 
     root_id = doc.get("@id") or doc.get("id")
     referenced: Set[str] = set()
 
-    def extract_from_value(value, depth: int = 0):
-        """Recursively extract @id values from nested structures."""
+    # Walk everything below the root with an explicit stack instead of
+    # recursion; every object found there is nested, so its @id is a reference
+    stack = list(doc.values())
+    while stack:
+        value = stack.pop()
         if isinstance(value, dict):
             obj_id = value.get("@id") or value.get("id")
-            if obj_id and depth > 0 and obj_id != root_id:
+            if obj_id and obj_id != root_id:
                 # Only add if it looks like an IRI (not a blank node)
                 if isinstance(obj_id, str) and not obj_id.startswith("_:"):
                     referenced.add(obj_id)
-            for v in value.values():
-                extract_from_value(v, depth + 1)
+            stack.extend(value.values())
         elif isinstance(value, list):
-            for item in value:
-                extract_from_value(item, depth + 1)
+            stack.extend(value)
 
-    extract_from_value(doc)
     return root_id, referenced
 
 
+def _drop_nested_dirs(dirs: Set[Path]) -> List[Path]:
+    """
+    Drop resolved directories that another directory's walk already covers.
+
+    A directory is dropped when one of its ancestors is in ``dirs`` and no
+    directory between them is pruned by the walk, so the remaining roots
+    yield the same files with each directory scanned once.
+
+    Args:
+        dirs: Resolved directory paths
+
+    Returns:
+        The covering directories, sorted
+    """
+    kept: List[Path] = []
+    # Sorted order puts every ancestor before its descendants
+    for directory in sorted(dirs):
+        covered = any(
+            root in directory.parents
+            and _PRUNED_DIR_NAMES.isdisjoint(directory.relative_to(root).parts)
+            for root in kept
+        )
+        if not covered:
+            kept.append(directory)
+    return kept
+
+
 def _is_did_document(file_path: Path, root_id: Optional[str]) -> bool:
     """
     Check if a file is a DID document.
@@ -497,6 +789,7 @@ def _is_did_document(file_path: Path, root_id: Optional[str]) -> bool:
 
 def discover_data_hierarchy(
     paths: List[Union[str, Path]],
+    jobs: int = 1,
 ) -> tuple:
     """
     Discover top-level files and fixture mappings from paths.
@@ -514,6 +807,9 @@ def discover_data_hierarchy(
 
     Args:
         paths: List of files or directories to process
+        jobs: Number of threads used to read and parse the discovered files
+            (1 = in-process). Results are consumed in collection order, so
+            the output does not depend on this value.
 
     Returns:
         Tuple of (files_to_validate, iri_to_file_map, metadata)
@@ -544,18 +840,27 @@ def discover_data_hierarchy(
     all_files: List[Path] = []
     if fixture_scan_dirs:
         all_files = collect_jsonld_files(
-            list(fixture_scan_dirs), return_pathlib=True, sort_and_deduplicate=True
+            _drop_nested_dirs(fixture_scan_dirs),
+            return_pathlib=True,
+            sort_and_deduplicate=True,
         )
 
-    # Single pass: build IRI→file mapping and track DID documents
+    # Single pass: build IRI→file mapping, track DID documents and pick the
+    # top-level files. Top-level = explicit files + non-DID files discovered
+    # from explicit directory arguments only. All DID documents are fixtures
+    # (for IRI resolution), not validated.
     iri_to_file: Dict[str, Path] = {}
     iri_to_all_files: Dict[str, List[Path]] = {}  # Track all files per IRI
-    file_ids: Dict[Path, Optional[str]] = {}
     did_documents: Set[Path] = set()
+    top_level: Set[Path] = set(explicit_files)
 
-    for f in all_files:
-        root_id, refs = extract_jsonld_iris(f)
-        file_ids[f] = root_id
+    if jobs > 1 and len(all_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(all_files))) as executor:
+            extracted = list(executor.map(extract_jsonld_iris, all_files))
+    else:
+        extracted = map(extract_jsonld_iris, all_files)
+
+    for f, (root_id, _) in zip(all_files, extracted):
         if root_id:
             iri_to_file[root_id] = f
             # Track duplicates
@@ -563,20 +868,11 @@ def discover_data_hierarchy(
                 iri_to_all_files[root_id] = []
             iri_to_all_files[root_id].append(f)
 
-        # Track DID documents
         if _is_did_document(f, root_id):
             did_documents.add(f)
-
-    # Top-level = explicit files + non-DID files discovered from explicit
-    # directory arguments only. All DID documents are fixtures (for IRI
-    # resolution), not validated.
-    top_level: Set[Path] = set(explicit_files)
-    for f, fid in file_ids.items():
-        # Only non-DID documents found under explicitly provided directories are
-        # auto-promoted to top-level validation inputs.
-        if f not in did_documents and any(
-            root in f.parents or f == root for root in validation_dirs
-        ):
+        elif validation_dirs and not validation_dirs.isdisjoint(f.parents):
+            # Only non-DID documents found under explicitly provided
+            # directories are auto-promoted to top-level validation inputs.
             top_level.add(f)
 
     # Find duplicate IDs
@@ -8,6 +8,7 @@ FEATURE SET:
 2. load_graphs - Load multiple files into combined graph
 3. load_jsonld_files - Load JSON-LD files with prefix extraction
 4. load_turtle_files - Load Turtle files into graph
+   load_turtle_predicates - Stream a Turtle file, keeping selected predicates
 5. load_jsonld_with_context - Load JSON-LD with prefix extraction
 6. load_fixtures_for_iris - Resolve and load fixture files for referenced IRIs
 7. extract_external_iris - Find referenced IRIs that should be fixture-loaded
@@ -60,6 +61,7 @@ DEPENDENCIES:
 =============
 - rdflib: For RDF graph handling
 - oxrdflib (optional): For Oxigraph performance optimization
+- pyoxigraph (optional, ships with oxrdflib): Streaming Turtle parser
 
 NOTES:
 ======
@@ -73,11 +75,17 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from urllib.request import Request, build_opener, HTTPSHandler
 
 import rdflib
-from rdflib import Graph
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
 
 from omb.core.constants import FAST_STORE
 from omb.core.iri_utils import did_web_to_url, is_did_web
@@ -94,12 +102,30 @@ __all__ = [
     "load_graphs",
     "load_jsonld_files",
     "load_turtle_files",
+    "load_turtle_predicates",
     "load_jsonld_with_context",
     "load_fixtures_for_iris",
     "extract_external_iris",
 ]
 
 
+def _resolve_format(path: Path, format: str) -> str:
+    """Return ``format``, or the format implied by the file extension for "auto"."""
+    if format != "auto":
+        return format
+
+    suffix = path.suffix.lower()
+    if suffix in (".json", ".jsonld"):
+        return "json-ld"
+    elif suffix == ".ttl":
+        return "turtle"
+    elif suffix in (".rdf", ".xml"):
+        return "xml"
+    elif suffix == ".nt":
+        return "nt"
+    return "turtle"  # Default fallback
+
+
 def load_graph(
     file_path: Path,
     format: str = "auto",
@@ -122,21 +148,7 @@ def load_graph(
     graph = Graph(store=store)
     path = Path(file_path)
 
-    # Auto-detect format from extension
-    if format == "auto":
-        suffix = path.suffix.lower()
-        if suffix in (".json", ".jsonld"):
-            format = "json-ld"
-        elif suffix == ".ttl":
-            format = "turtle"
-        elif suffix in (".rdf", ".xml"):
-            format = "xml"
-        elif suffix == ".nt":
-            format = "nt"
-        else:
-            format = "turtle"  # Default fallback
-
-    graph.parse(str(path), format=format)
+    graph.parse(str(path), format=_resolve_format(path, format))
     return graph
 
 
@@ -148,6 +160,9 @@ def load_graphs(
     """
     Load multiple files into a combined graph.
 
+    Every file is parsed straight into the same graph, so there is no
+    per-file staging graph to build and merge afterwards.
+
     Args:
         file_paths: List of file paths to load
         format: RDF format ("auto" for auto-detection)
@@ -166,8 +181,7 @@ def load_graphs(
             logger.error("Graph file not found: %s", path)
             raise FileNotFoundError(f"Graph file not found: {path}")
         try:
-            temp_graph = load_graph(path, format=format, store="default")
-            combined += temp_graph
+            combined.parse(str(path), format=_resolve_format(path, format))
         except Exception as e:
             logger.error("Failed to load %s: %s", path, e)
             raise RuntimeError(f"Failed to load graph file {path}: {e}") from e
@@ -298,6 +312,62 @@ def load_turtle_files(
     return graph
 
 
+def _from_ox(term) -> Node:
+    """Convert a pyoxigraph subject/predicate/object term to an rdflib term."""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    return Literal(term.value, datatype=URIRef(term.datatype.value))
+
+
+def load_turtle_predicates(
+    file_path: Path,
+    predicates: Iterable[URIRef],
+    store: str = "default",
+) -> Graph:
+    """
+    Load only the triples of a Turtle file that use one of ``predicates``.
+
+    The file is streamed through Oxigraph's native parser and filtered
+    before anything is added to the graph, which is much cheaper than
+    materializing every triple when callers only look at a few predicates.
+    The file's ``@prefix`` declarations are bound on the returned graph.
+    Without pyoxigraph the whole file is parsed with rdflib instead.
+
+    Args:
+        file_path: Path to the Turtle file to load
+        predicates: Predicates whose triples should be kept
+        store: RDF store to use (default: in-memory, since the filtered
+            graph is small)
+
+    Returns:
+        Graph containing the matching triples
+    """
+    path = Path(file_path)
+    if pyoxigraph is None:
+        return load_graph(path, format="turtle", store=store)
+
+    wanted = {pyoxigraph.NamedNode(str(p)) for p in predicates}
+    graph = Graph(store=store)
+
+    with path.open("rb") as f:
+        parser = pyoxigraph.parse(
+            f, pyoxigraph.RdfFormat.TURTLE, base_iri=path.resolve().as_uri()
+        )
+        graph.addN(
+            (_from_ox(q.subject), _from_ox(q.predicate), _from_ox(q.object), graph)
+            for q in parser
+            if q.predicate in wanted
+        )
+        for prefix, namespace in parser.prefixes.items():
+            graph.bind(prefix, namespace)
+
+    return graph
+
+
 def load_jsonld_with_context(file_path: Path) -> Tuple[Graph, Dict[str, str]]:
     """
     Load JSON-LD file with prefix extraction.
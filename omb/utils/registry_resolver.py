@@ -44,11 +44,16 @@ See also:
     - omb.validators.shacl: Main consumer of this utility
 """
 
+import hashlib
 import json
+import os
 import re
 import warnings
 import xml.etree.ElementTree as ET
-from pathlib import Path
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from pathlib import Path, PurePosixPath
 from typing import Dict, List, Optional, Set, Tuple
 
 from omb.core.logging import get_logger
@@ -56,6 +61,12 @@ from omb.core.paths import builtin_data_root
 
 # Prefix for temporary domains created by --data-paths mode.
 TEMP_DOMAIN_PREFIX = "custom-path-"
+# Qualified tag of <uri> entries in an OASIS XML catalog.
+CATALOG_URI_TAG = "{urn:oasis:names:tc:entity:xmlns:xml:catalog}uri"
+# Suffixes of catalog entries treated as ontology files.
+ONTOLOGY_SUFFIXES = frozenset({".ttl", ".rdf", ".owl", ".xml", ".nt", ".n3"})
+# Characters that end an IRI namespace prefix.
+_IRI_SEPARATOR_RE = re.compile(r"[/#]")
 logger = get_logger(__name__)
 
 
@@ -70,6 +81,29 @@ class RegistryResolver:
         domains = resolver.list_domains()
     """
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute access.
+    # Listed in __init__ assignment order; keep __weakref__ so instances can
+    # still be weakly referenced as before.
+    __slots__ = (
+        "root_dir",
+        "_registry",
+        "_test_catalog",
+        "_test_fixtures",
+        "_test_index",
+        "_test_paths",
+        "_artifact_domains",
+        "_domain_iris",
+        "_iri_to_domain",
+        "_iri_prefix_index",
+        "_imports_catalog_entries",
+        "_imports_context_entries",
+        "_imports_shacl_entries",
+        "_imports_ontology_paths",
+        "_imports_iri_prefixes",
+        "_http_enabled",
+        "__weakref__",
+    )
+
     def __init__(self, root_dir: Path = None, enable_http: bool = False):
         """
         Initialize the registry resolver.
@@ -82,21 +116,32 @@ class RegistryResolver:
         """
         self.root_dir = Path(root_dir or builtin_data_root()).resolve()
         self._registry: Dict = {}
-        self._catalog: Dict[str, Dict] = {}  # Full catalog (test-data + fixtures)
-        self._fixtures_catalog: Dict[str, str] = {}  # Fixture IRIs only
+        # Full test catalog (test-data + fixtures); parsed on first use
+        self._test_catalog: Optional[Dict[str, Dict]] = None
+        self._test_fixtures: Dict[str, str] = {}  # Fixture IRIs only
+        # (category, domain) -> test catalog entries; rebuilt after catalog writes
+        self._test_index: Optional[Dict[Tuple[str, str], List[Dict]]] = None
+        # Catalog path string -> absolute Path; a Path caches its string form,
+        # hash and sort key, so reusing it makes repeated lookups cheap
+        self._test_paths: Dict[str, Path] = {}
         self._artifact_domains: Dict[str, Dict[str, object]] = {}
         self._domain_iris: Dict[str, str] = {}
         self._iri_to_domain: Dict[str, str] = {}
+        # Namespace prefix ("/" or "#" terminated) -> (index order, domain)
+        self._iri_prefix_index: Dict[str, Tuple[int, str]] = {}
         self._imports_catalog_entries: Optional[Dict[str, str]] = None
         self._imports_context_entries: Optional[Dict[str, str]] = None
         self._imports_shacl_entries: Optional[Dict[str, List[str]]] = None
+        # Sorted, unique ontology paths of the imports catalog
+        self._imports_ontology_paths: Tuple[str, ...] = ()
+        # Every IRI prefix of every imported base IRI, for str.startswith
+        self._imports_iri_prefixes: Tuple[str, ...] = ()
         self._http_enabled: bool = False
 
         if enable_http and not self._has_local_catalogs():
             self._bootstrap_from_http()
 
         self._load_registry()
-        self._load_catalog()
         self._load_artifacts_catalog()
         self._build_iri_index()
 
@@ -139,6 +184,24 @@ class RegistryResolver:
         except Exception as e:
             warnings.warn(f"Could not load registry: {e}")
 
+    def _ensure_test_catalog(self) -> None:
+        """Parse tests/catalog-v001.xml on the first test or fixture lookup."""
+        if self._test_catalog is None:
+            self._test_catalog = {}
+            self._load_catalog()
+
+    @property
+    def _catalog(self) -> Dict[str, Dict]:
+        """Full test catalog (test-data + fixtures), loaded on first access."""
+        self._ensure_test_catalog()
+        return self._test_catalog
+
+    @property
+    def _fixtures_catalog(self) -> Dict[str, str]:
+        """Fixture IRI -> path, from the test catalog and registered mappings."""
+        self._ensure_test_catalog()
+        return self._test_fixtures
+
     def _load_catalog(self) -> None:
         """
         Load unified test catalog for test data discovery and fixture resolution.
@@ -153,84 +216,98 @@ class RegistryResolver:
         try:
             tree = ET.parse(catalog_path)
             root = tree.getroot()
-            ns = {"cat": "urn:oasis:names:tc:entity:xmlns:xml:catalog"}
 
-            # Parse with namespace first
-            for uri_elem in root.findall("cat:uri", ns):
+            for uri_elem in self._catalog_uri_elements(root):
                 test_id = uri_elem.get("name")
                 path = uri_elem.get("uri")
-                domain = uri_elem.get("domain")
-                test_type = uri_elem.get("test-type")
                 category = uri_elem.get("category")
 
                 if test_id and path:
                     self._catalog[test_id] = {
                         "path": path,
-                        "domain": domain,
-                        "test_type": test_type,
+                        "domain": uri_elem.get("domain"),
+                        "test_type": uri_elem.get("test-type"),
                         "category": category,
                     }
 
                     if category == "fixture":
                         self._fixtures_catalog[test_id] = path
 
-            # Try without namespace if nothing found
-            if not self._catalog:
-                for uri_elem in root.findall("uri"):
-                    test_id = uri_elem.get("name")
-                    path = uri_elem.get("uri")
-                    domain = uri_elem.get("domain")
-                    test_type = uri_elem.get("test-type")
-                    category = uri_elem.get("category")
-
-                    if test_id and path:
-                        self._catalog[test_id] = {
-                            "path": path,
-                            "domain": domain,
-                            "test_type": test_type,
-                            "category": category,
-                        }
-
-                        if category == "fixture":
-                            self._fixtures_catalog[test_id] = path
-
         except Exception as e:
             warnings.warn(f"Could not parse test catalog: {e}")
 
-    def _normalize_catalog_path(self, base_dir: str, uri: str) -> Path:
+    @staticmethod
+    def _catalog_uri_elements(root: ET.Element) -> List[ET.Element]:
         """
-        Normalize a catalog URI to a repository-relative path.
+        Collect a catalog's top-level <uri> entries in one pass.
+
+        Namespaced entries are used when present; plain <uri> elements are
+        the fallback for catalogs written without the OASIS namespace.
 
         Args:
-            base_dir: Base directory for relative paths (e.g., "artifacts", "imports")
-            uri: URI attribute from catalog entry
+            root: Root element of a parsed catalog
 
         Returns:
-            Repository-relative Path
+            The <uri> elements in document order
+        """
+        namespaced: List[ET.Element] = []
+        plain: List[ET.Element] = []
+        for elem in root:
+            if elem.tag == CATALOG_URI_TAG:
+                namespaced.append(elem)
+            elif elem.tag == "uri":
+                plain.append(elem)
+        return namespaced or plain
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _relative_catalog_path(base_dir: str, uri: str) -> Optional[str]:
+        """
+        Resolve a relative catalog URI against its base directory.
+
+        Pure in its arguments, so every resolver shares the result.
+
+        Returns:
+            Repository-relative POSIX path string, or None if ``uri`` is absolute
         """
         uri_path = Path(uri)
         if uri_path.is_absolute():
-            return Path(self.to_relative(uri_path))
+            return None
         if uri_path.parts and uri_path.parts[0] == base_dir:
-            return uri_path
-        return Path(base_dir) / uri_path
+            return uri_path.as_posix()
+        return (Path(base_dir) / uri_path).as_posix()
+
+    def _normalize_catalog_path(self, base_dir: str, uri: str) -> str:
+        """
+        Normalize a catalog URI to a repository-relative path.
+
+        Args:
+            base_dir: Base directory for relative paths (e.g., "artifacts", "imports")
+            uri: URI attribute from catalog entry
+
+        Returns:
+            Repository-relative POSIX path string
+        """
+        rel_posix = self._relative_catalog_path(base_dir, uri)
+        if rel_posix is None:
+            return Path(self.to_relative(Path(uri))).as_posix()
+        return rel_posix
 
-    def _extract_domain_from_artifact_path(self, rel_path: Path) -> Optional[str]:
+    @staticmethod
+    def _extract_domain_from_artifact_path(rel_posix: str) -> Optional[str]:
         """
         Extract domain name from an artifacts catalog path.
 
         Args:
-            rel_path: Repository-relative path to an artifact file
+            rel_posix: Repository-relative POSIX path to an artifact file
 
         Returns:
             Domain name or None if not determinable
         """
-        parts = rel_path.parts
-        if not parts:
-            return None
-        if parts[0] == "artifacts" and len(parts) > 1:
-            return parts[1]
-        return parts[0]
+        first, _, rest = rel_posix.partition("/")
+        if first == "artifacts" and rest:
+            return rest.partition("/")[0]
+        return first or None
 
     def _load_artifacts_catalog(self) -> None:
         """
@@ -252,50 +329,45 @@ class RegistryResolver:
             warnings.warn(f"Could not parse artifacts catalog: {e}")
             return
 
-        ns = {"cat": "urn:oasis:names:tc:entity:xmlns:xml:catalog"}
-        uri_elems = root.findall("cat:uri", ns)
-        if not uri_elems:
-            uri_elems = root.findall("uri")
-
-        for uri_elem in uri_elems:
+        for uri_elem in self._catalog_uri_elements(root):
             iri = uri_elem.get("name")
             uri = uri_elem.get("uri")
             if not iri or not uri:
                 continue
 
-            rel_path = self._normalize_catalog_path("artifacts", uri)
-            domain = self._extract_domain_from_artifact_path(rel_path)
+            rel_posix = self._normalize_catalog_path("artifacts", uri)
+            domain = self._extract_domain_from_artifact_path(rel_posix)
             if not domain:
                 continue
 
             if domain not in self._artifact_domains:
                 self._artifact_domains[domain] = {
                     "ontology": None,
-                    "shacl": [],
+                    # Collected as a set while loading; sorted into a list below
+                    "shacl": set(),
                     "jsonld": None,
                 }
 
-            if self._is_context_path(rel_path):
+            kind = self._catalog_path_kind(rel_posix)
+
+            if kind == "context":
                 if self._artifact_domains[domain]["jsonld"] is None:
-                    self._artifact_domains[domain]["jsonld"] = rel_path.as_posix()
+                    self._artifact_domains[domain]["jsonld"] = rel_posix
                 continue
 
-            if self._is_shacl_path(rel_path):
-                shacl_list = self._artifact_domains[domain]["shacl"]
-                shacl_path = rel_path.as_posix()
-                if shacl_path not in shacl_list:
-                    shacl_list.append(shacl_path)
+            if kind == "shacl":
+                self._artifact_domains[domain]["shacl"].add(rel_posix)
                 continue
 
-            if self._is_ontology_file(rel_path):
+            if kind == "ontology":
                 if self._artifact_domains[domain]["ontology"] is None:
-                    self._artifact_domains[domain]["ontology"] = rel_path.as_posix()
+                    self._artifact_domains[domain]["ontology"] = rel_posix
                 if domain not in self._domain_iris:
                     self._domain_iris[domain] = iri
 
         # Normalize SHACL lists for consistent output
         for info in self._artifact_domains.values():
-            info["shacl"] = sorted(set(info["shacl"]))
+            info["shacl"] = sorted(info["shacl"])
 
     @staticmethod
     def _catalog_resource_base_iri(iri: str) -> str:
@@ -337,31 +409,27 @@ class RegistryResolver:
             warnings.warn(f"Could not parse imports catalog: {e}")
             return {}, {}, {}
 
-        ns = {"cat": "urn:oasis:names:tc:entity:xmlns:xml:catalog"}
-        uri_elems = root.findall("cat:uri", ns)
-        if not uri_elems:
-            uri_elems = root.findall("uri")
-
         ontology_entries: Dict[str, str] = {}
         context_entries: Dict[str, str] = {}
         shacl_entries: Dict[str, List[str]] = {}
 
-        for uri_elem in uri_elems:
+        for uri_elem in self._catalog_uri_elements(root):
             iri = uri_elem.get("name")
             uri = uri_elem.get("uri")
             if not iri or not uri:
                 continue
 
-            rel_path = self._normalize_catalog_path("imports", uri)
-            if self._is_context_path(rel_path):
-                context_entries[iri] = rel_path.as_posix()
+            rel_posix = self._normalize_catalog_path("imports", uri)
+            kind = self._catalog_path_kind(rel_posix)
+            if kind == "context":
+                context_entries[iri] = rel_posix
                 continue
-            if self._is_shacl_path(rel_path):
+            if kind == "shacl":
                 base_iri = self._catalog_resource_base_iri(iri)
-                shacl_entries.setdefault(base_iri, []).append(rel_path.as_posix())
+                shacl_entries.setdefault(base_iri, []).append(rel_posix)
                 continue
-            if self._is_ontology_file(rel_path):
-                ontology_entries[iri] = rel_path.as_posix()
+            if kind == "ontology":
+                ontology_entries[iri] = rel_posix
 
         return (
             ontology_entries,
@@ -369,74 +437,53 @@ class RegistryResolver:
             {base_iri: sorted(set(paths)) for base_iri, paths in shacl_entries.items()},
         )
 
-    def _load_imports_catalog_entries(self) -> Dict[str, str]:
+    def _ensure_imports_catalog(self) -> None:
         """
-        Load base ontology entries from imports/catalog-v001.xml.
+        Parse imports/catalog-v001.xml once, on first use.
 
-        Returns:
-            Mapping of base ontology IRI to repository-relative path
+        A single parse fills the ontology, context and SHACL mappings
+        together, whichever getter asks first.
         """
-        ontology_entries, context_entries, shacl_entries = (
-            self._parse_imports_catalog_entries()
-        )
-        self._imports_context_entries = context_entries
-        self._imports_shacl_entries = shacl_entries
-        return ontology_entries
-
-    def _load_imports_context_entries(self) -> Dict[str, str]:
-        """
-        Load JSON-LD context entries from imports/catalog-v001.xml.
-
-        Returns:
-            Mapping of context URL to repository-relative context file path
-        """
-        ontology_entries, context_entries, shacl_entries = (
-            self._parse_imports_catalog_entries()
-        )
-        self._imports_catalog_entries = ontology_entries
-        self._imports_shacl_entries = shacl_entries
-        return context_entries
-
-    def _load_imports_shacl_entries(self) -> Dict[str, List[str]]:
-        """
-        Load SHACL entries from imports/catalog-v001.xml.
-
-        Returns:
-            Mapping of base IRI -> repository-relative SHACL file paths
-        """
-        ontology_entries, context_entries, shacl_entries = (
-            self._parse_imports_catalog_entries()
-        )
-        self._imports_catalog_entries = ontology_entries
-        self._imports_context_entries = context_entries
-        return shacl_entries
-
-    @staticmethod
-    def _is_context_path(path: Path) -> bool:
-        path_str = path.as_posix().lower()
-        return path_str.endswith((".context.jsonld", ".context.json"))
+        if self._imports_catalog_entries is None:
+            (
+                self._imports_catalog_entries,
+                self._imports_context_entries,
+                self._imports_shacl_entries,
+            ) = self._parse_imports_catalog_entries()
+            self._imports_ontology_paths = tuple(
+                sorted(set(self._imports_catalog_entries.values()))
+            )
+            self._imports_iri_prefixes = tuple(
+                dict.fromkeys(
+                    prefix
+                    for base_iri in self._imports_catalog_entries
+                    for prefix in self._base_iri_prefixes(base_iri)
+                )
+            )
 
     @staticmethod
-    def _is_shacl_path(path: Path) -> bool:
-        path_str = path.as_posix().lower()
-        return ".shacl." in path_str or path_str.endswith(".shacl.ttl")
-
-    @classmethod
-    def _is_ontology_file(cls, path: Path) -> bool:
+    @lru_cache(maxsize=4096)
+    def _catalog_path_kind(path_str: str) -> Optional[str]:
         """
-        Check if a catalog entry looks like an ontology file (not context/shapes).
+        Classify a catalog entry path by file name.
+
+        Context files take precedence over SHACL shapes, and both over
+        ontology files, so e.g. ``x.shacl.ttl`` is never an ontology.
 
         Args:
-            path: Path to check (relative)
+            path_str: Repository-relative POSIX path
 
         Returns:
-            True if path is a likely ontology file
-        """
-        if cls._is_context_path(path):
-            return False
-        if cls._is_shacl_path(path):
-            return False
-        return path.suffix.lower() in {".ttl", ".rdf", ".owl", ".xml", ".nt", ".n3"}
+            "context", "shacl", "ontology", or None for anything else
+        """
+        lowered = path_str.lower()
+        if lowered.endswith((".context.jsonld", ".context.json")):
+            return "context"
+        if ".shacl." in lowered:
+            return "shacl"
+        if PurePosixPath(lowered).suffix in ONTOLOGY_SUFFIXES:
+            return "ontology"
+        return None
 
     def _build_iri_index(self) -> None:
         """Build IRI -> domain mapping from artifacts catalog."""
@@ -448,6 +495,13 @@ class RegistryResolver:
                 if base_iri != iri:
                     self._iri_to_domain[base_iri] = domain
 
+        # Each IRI claims the "/" and "#" terminated forms of itself as
+        # prefixes; the first IRI to claim a prefix keeps it
+        self._iri_prefix_index = {}
+        for rank, (iri, domain) in enumerate(self._iri_to_domain.items()):
+            for prefix in (iri.rstrip("/") + "/", iri.rstrip("#") + "#"):
+                self._iri_prefix_index.setdefault(prefix, (rank, domain))
+
     # =========================================================================
     # Core Methods (return repo-relative paths as strings)
     # =========================================================================
@@ -528,11 +582,8 @@ class RegistryResolver:
         Returns:
             List of repository-relative paths to base ontology files
         """
-        if self._imports_catalog_entries is None:
-            self._imports_catalog_entries = self._load_imports_catalog_entries()
-        if self._imports_catalog_entries:
-            return sorted(set(self._imports_catalog_entries.values()))
-        return []
+        self._ensure_imports_catalog()
+        return list(self._imports_ontology_paths)
 
     def get_import_context_mappings(self) -> Dict[str, str]:
         """
@@ -541,9 +592,8 @@ class RegistryResolver:
         Returns:
             Dict mapping context URL -> repository-relative context path
         """
-        if self._imports_context_entries is None:
-            self._imports_context_entries = self._load_imports_context_entries()
-        return dict(self._imports_context_entries or {})
+        self._ensure_imports_catalog()
+        return dict(self._imports_context_entries)
 
     def get_base_ontology_paths_for_iris(self, iris: Set[str]) -> List[str]:
         """
@@ -555,14 +605,14 @@ class RegistryResolver:
         Returns:
             List of repository-relative paths to base ontology files
         """
-        if self._imports_catalog_entries is None:
-            self._imports_catalog_entries = self._load_imports_catalog_entries()
+        self._ensure_imports_catalog()
         if not self._imports_catalog_entries:
             return []
 
+        sorted_iris = sorted(iris)
         matches: List[str] = []
         for base_iri, path in self._imports_catalog_entries.items():
-            if self._iri_matches_base(iris, base_iri):
+            if self._iri_matches_base(sorted_iris, base_iri):
                 matches.append(path)
 
         return sorted(set(matches))
@@ -577,14 +627,14 @@ class RegistryResolver:
         Returns:
             List of repository-relative SHACL paths
         """
-        if self._imports_shacl_entries is None:
-            self._imports_shacl_entries = self._load_imports_shacl_entries()
+        self._ensure_imports_catalog()
         if not self._imports_shacl_entries:
             return []
 
+        sorted_iris = sorted(iris)
         matches: List[str] = []
         for base_iri, paths in self._imports_shacl_entries.items():
-            if self._iri_matches_base(iris, base_iri):
+            if self._iri_matches_base(sorted_iris, base_iri):
                 matches.extend(paths)
 
         return sorted(set(matches))
@@ -599,31 +649,49 @@ class RegistryResolver:
         Returns:
             True if the IRI's namespace is covered by imports/catalog-v001.xml
         """
-        if self._imports_catalog_entries is None:
-            self._imports_catalog_entries = self._load_imports_catalog_entries()
-        if not self._imports_catalog_entries:
-            return False
-        return self._iri_matches_base({iri}, list(self._imports_catalog_entries.keys()))
+        self._ensure_imports_catalog()
+        # One C-level call tests the IRI against all prefixes at once; an
+        # empty tuple (no imports catalog) matches nothing
+        return iri.startswith(self._imports_iri_prefixes)
 
     @staticmethod
-    def _iri_matches_base(iris: Set[str], base_iris) -> bool:
-        """Check if any IRI matches any base IRI (single or collection)."""
+    @cache
+    def _base_iri_prefixes(base_iri: str) -> Tuple[str, ...]:
+        """
+        List the IRI prefixes that belong to a base IRI.
+
+        Covers the base itself and its ``/`` and ``#`` separated forms, for
+        both the http and https scheme.
+        """
+        candidates = [base_iri]
+        if base_iri.startswith("http://"):
+            candidates.append("https://" + base_iri[len("http://") :])
+        elif base_iri.startswith("https://"):
+            candidates.append("http://" + base_iri[len("https://") :])
+
+        prefixes: List[str] = []
+        for candidate in candidates:
+            base = candidate.rstrip("#/")
+            prefixes.extend((candidate, base + "/", base + "#"))
+        return tuple(dict.fromkeys(prefixes))
+
+    @classmethod
+    def _iri_matches_base(cls, sorted_iris: List[str], base_iris) -> bool:
+        """
+        Check if any IRI matches any base IRI (single or collection).
+
+        ``sorted_iris`` must be sorted: every IRI sharing a prefix then sits
+        at the prefix's insertion point, so each prefix costs one bisection
+        instead of a scan over all IRIs.
+        """
         if isinstance(base_iris, str):
             base_iris = [base_iris]
+        count = len(sorted_iris)
         for base_iri in base_iris:
-            candidates = {base_iri}
-            if base_iri.startswith("http://"):
-                candidates.add("https://" + base_iri[len("http://") :])
-            elif base_iri.startswith("https://"):
-                candidates.add("http://" + base_iri[len("https://") :])
-
-            for candidate in candidates:
-                base = candidate.rstrip("#/")
-                for iri in iris:
-                    if iri == candidate or iri.startswith(candidate):
-                        return True
-                    if iri.startswith(base + "/") or iri.startswith(base + "#"):
-                        return True
+            for prefix in cls._base_iri_prefixes(base_iri):
+                index = bisect_left(sorted_iris, prefix)
+                if index < count and sorted_iris[index].startswith(prefix):
+                    return True
         return False
 
     # =========================================================================
@@ -645,19 +713,34 @@ class RegistryResolver:
             List of absolute paths to test files
         """
         test_files = set()
+        test_paths = self._test_paths
 
-        for test_id, metadata in self._catalog.items():
-            if (
-                metadata.get("category") == category
-                and metadata.get("domain") == domain
-            ):
-                if test_type is None or metadata.get("test_type") == test_type:
-                    file_path = self.root_dir / metadata["path"]
-                    if file_path.exists():
-                        test_files.add(file_path)
+        for metadata in self._get_test_index().get((category, domain), ()):
+            if test_type is None or metadata.get("test_type") == test_type:
+                rel_path = metadata["path"]
+                file_path = test_paths.get(rel_path)
+                if file_path is None:
+                    file_path = test_paths[rel_path] = self.root_dir / rel_path
+                if file_path.exists():
+                    test_files.add(file_path)
 
         return sorted(test_files)
 
+    def _get_test_index(self) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Group test catalog entries by (category, domain), building on first use.
+
+        Returns:
+            Mapping of (category, domain) to catalog entries in catalog order
+        """
+        if self._test_index is None:
+            index: Dict[Tuple[str, str], List[Dict]] = {}
+            for metadata in self._catalog.values():
+                key = (metadata.get("category"), metadata.get("domain"))
+                index.setdefault(key, []).append(metadata)
+            self._test_index = index
+        return self._test_index
+
     def get_all_cataloged_files(
         self,
         extensions: set = None,
@@ -684,10 +767,30 @@ class RegistryResolver:
         """
         files_by_ext: Dict[str, List[Path]] = {}
         domains_set = set(domains) if domains else None
+        # Directory -> {entry name: is symlink}; one scandir per directory
+        # answers the existence check for every cataloged file in it
+        listings: Dict[str, Dict[str, bool]] = {}
+
+        def exists(file_path: Path) -> bool:
+            """Existence check served from the parent directory's listing."""
+            parent, name = os.path.split(file_path)
+            names = listings.get(parent)
+            if names is None:
+                try:
+                    with os.scandir(parent) as scanner:
+                        names = {entry.name: entry.is_symlink() for entry in scanner}
+                except OSError:
+                    names = {}
+                listings[parent] = names
+            is_link = names.get(name)
+            if is_link is None:
+                return False
+            # A symlink only exists if its target does
+            return not is_link or file_path.exists()
 
         def add_file(file_path: Path) -> None:
             """Helper to add a file to the appropriate extension list."""
-            if not file_path.exists():
+            if not exists(file_path):
                 return
             ext = file_path.suffix
             if extensions is None or ext in extensions:
@@ -734,8 +837,10 @@ class RegistryResolver:
                     add_file(self.root_dir / paths["context"])
 
         # Sort and deduplicate each list
-        for ext in files_by_ext:
-            files_by_ext[ext] = sorted(set(files_by_ext[ext]))
+        for ext, ext_files in files_by_ext.items():
+            ext_files = list(dict.fromkeys(ext_files))
+            ext_files.sort()
+            files_by_ext[ext] = ext_files
 
         return files_by_ext
 
@@ -749,13 +854,11 @@ class RegistryResolver:
         Returns:
             Sorted list of domain names
         """
-        domains = set()
-        for metadata in self._catalog.values():
-            if metadata.get("category") == category:
-                domain = metadata.get("domain")
-                if domain:
-                    domains.add(domain)
-        return sorted(domains)
+        return sorted(
+            domain
+            for entry_category, domain in self._get_test_index()
+            if entry_category == category and domain
+        )
 
     def get_artifact_domains(self) -> List[str]:
         """
@@ -793,20 +896,16 @@ class RegistryResolver:
             if not file_path.is_absolute():
                 file_path = (self.root_dir / file_path).resolve()
 
-            # Create relative path from root
-            try:
-                rel_path = file_path.relative_to(self.root_dir)
-            except ValueError:
-                # File is outside repo, use absolute path
-                rel_path = file_path
-
+            # Relative path from root; files outside the repo keep their
+            # absolute path
             test_id = f"temporary:{domain}:{test_type}:file{i:03d}"
             self._catalog[test_id] = {
-                "path": str(rel_path),
+                "path": self.to_relative(file_path),
                 "domain": domain,
                 "test_type": test_type,
                 "category": "test-data",
             }
+        self._test_index = None
 
     def create_temporary_domain(self, paths: List[Path | str]) -> Optional[str]:
         """
@@ -822,8 +921,6 @@ class RegistryResolver:
         Returns:
             Temporary domain name, or None if no files found
         """
-        import hashlib
-
         file_paths = []
         for path in paths:
             resolved = Path(path).resolve()
@@ -834,9 +931,11 @@ class RegistryResolver:
             return None
 
         unique_file_paths = sorted(set(file_paths))
-        path_hash = hashlib.md5(
-            "|".join(str(path) for path in unique_file_paths).encode()
-        ).hexdigest()[:8]
+        # Short deterministic suffix, not a security hash; blake2b is faster
+        # than md5 and is not disabled in FIPS mode
+        path_hash = hashlib.blake2b(
+            "|".join(str(path) for path in unique_file_paths).encode(), digest_size=4
+        ).hexdigest()
         temp_domain = f"{TEMP_DOMAIN_PREFIX}{path_hash}"
 
         # Add temporary entries to catalog, classifying each file by the name of
@@ -862,7 +961,34 @@ class RegistryResolver:
 
         return temp_domain
 
-    def register_artifact_directory(self, artifact_dir: Path) -> List[str]:
+    @staticmethod
+    def _read_context_vocab(context_path: Path) -> Optional[str]:
+        """
+        Read the ``@vocab`` IRI from a JSON-LD context file.
+
+        Args:
+            context_path: Path to a ``.context.jsonld`` file
+
+        Returns:
+            The ``@vocab`` value, or None if absent or the file is unreadable
+        """
+        try:
+            with context_path.open("r", encoding="utf-8") as f:
+                ctx_data = json.load(f)
+            context = ctx_data.get("@context", {})
+            if isinstance(context, dict):
+                return context.get("@vocab")
+            if isinstance(context, list):
+                for entry in context:
+                    if isinstance(entry, dict) and "@vocab" in entry:
+                        return entry["@vocab"]
+        except Exception as e:
+            logger.warning("Could not extract IRI from context %s: %s", context_path, e)
+        return None
+
+    def register_artifact_directory(
+        self, artifact_dir: Path, jobs: int = 1
+    ) -> List[str]:
         """
         Register an external artifact directory with the resolver.
 
@@ -879,37 +1005,47 @@ class RegistryResolver:
         Args:
             artifact_dir: Absolute path to an artifacts directory.
                           Expected structure: ``artifact_dir/{domain}/{domain}.*``
+            jobs: Number of threads used to read the context files
+                (1 = in-process). Results are applied in domain order, so
+                the outcome does not depend on this value.
 
         Returns:
             List of domain names that were registered.
         """
-        import json as _json
-
         artifact_dir = Path(artifact_dir).resolve()
         registered: List[str] = []
 
         if not artifact_dir.is_dir():
             return registered
 
-        for child in sorted(artifact_dir.iterdir()):
-            if not child.is_dir():
-                continue
+        # Determine repo-relative base path for the domains
+        try:
+            rel_base = artifact_dir.relative_to(self.root_dir)
+        except ValueError:
+            # External directory — store absolute paths
+            rel_base = artifact_dir
+
+        context_domains: List[str] = []
+        context_paths: List[Path] = []
+
+        # One scandir for the domain directories and one listing per domain,
+        # instead of an iterdir plus an exists() call per expected file
+        with os.scandir(artifact_dir) as it:
+            domain_dirs = sorted(entry.path for entry in it if entry.is_dir())
 
-            domain = child.name
-            owl_path = child / f"{domain}.owl.ttl"
-            shacl_path = child / f"{domain}.shacl.ttl"
-            context_path = child / f"{domain}.context.jsonld"
+        for domain_dir in domain_dirs:
+            domain = os.path.basename(domain_dir)
+            try:
+                names = set(os.listdir(domain_dir))
+            except OSError:
+                continue
 
             # Need at least the ontology file
-            if not owl_path.exists():
+            if f"{domain}.owl.ttl" not in names:
                 continue
 
-            # Determine repo-relative path for the domain
-            try:
-                rel_base = artifact_dir.relative_to(self.root_dir)
-            except ValueError:
-                # External directory — store absolute paths
-                rel_base = artifact_dir
+            has_shacl = f"{domain}.shacl.ttl" in names
+            has_context = f"{domain}.context.jsonld" in names
 
             owl_rel = (rel_base / domain / f"{domain}.owl.ttl").as_posix()
             shacl_rel = (rel_base / domain / f"{domain}.shacl.ttl").as_posix()
@@ -918,34 +1054,30 @@ class RegistryResolver:
             # Build artifact domain entry
             info: Dict[str, object] = {
                 "ontology": owl_rel,
-                "shacl": [shacl_rel] if shacl_path.exists() else [],
-                "jsonld": ctx_rel if context_path.exists() else None,
+                "shacl": [shacl_rel] if has_shacl else [],
+                "jsonld": ctx_rel if has_context else None,
             }
             self._artifact_domains[domain] = info
 
-            # Extract IRI from context @vocab
-            if context_path.exists():
-                try:
-                    with context_path.open("r", encoding="utf-8") as f:
-                        ctx_data = _json.load(f)
-                    context = ctx_data.get("@context", {})
-                    vocab = None
-                    if isinstance(context, dict):
-                        vocab = context.get("@vocab")
-                    elif isinstance(context, list):
-                        for entry in context:
-                            if isinstance(entry, dict) and "@vocab" in entry:
-                                vocab = entry["@vocab"]
-                                break
-                    if vocab:
-                        self._domain_iris[domain] = vocab
-                except Exception as e:
-                    logger.warning(
-                        "Could not extract IRI from context %s: %s", context_path, e
-                    )
+            # Extract IRI from context @vocab (read below)
+            if has_context:
+                context_domains.append(domain)
+                context_paths.append(Path(domain_dir, f"{domain}.context.jsonld"))
 
             registered.append(domain)
 
+        if jobs > 1 and len(context_paths) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(jobs, len(context_paths))
+            ) as executor:
+                vocabs = list(executor.map(self._read_context_vocab, context_paths))
+        else:
+            vocabs = map(self._read_context_vocab, context_paths)
+
+        for domain, vocab in zip(context_domains, vocabs):
+            if vocab:
+                self._domain_iris[domain] = vocab
+
         # Rebuild IRI index with newly registered domains
         if registered:
             self._build_iri_index()
@@ -965,17 +1097,11 @@ class RegistryResolver:
         Returns:
             Number of fixtures registered
         """
-        count = 0
-        for iri, file_path in mappings.items():
-            try:
-                rel_path = str(file_path.relative_to(self.root_dir))
-            except ValueError:
-                rel_path = str(file_path)
-
-            self._fixtures_catalog[iri] = rel_path
-            count += 1
-
-        return count
+        fixtures = {
+            iri: self.to_relative(file_path) for iri, file_path in mappings.items()
+        }
+        self._fixtures_catalog.update(fixtures)
+        return len(fixtures)
 
     # =========================================================================
     # Bulk Accessors
@@ -1025,14 +1151,15 @@ class RegistryResolver:
         if rdf_type in self._iri_to_domain:
             return self._iri_to_domain[rdf_type]
 
-        # Check prefix match
-        for iri, domain in self._iri_to_domain.items():
-            if rdf_type.startswith(iri.rstrip("/") + "/"):
-                return domain
-            if rdf_type.startswith(iri.rstrip("#") + "#"):
-                return domain
+        # Check prefix match: look up every "/" or "#" terminated prefix of
+        # the type and keep the earliest indexed IRI, as a linear scan would
+        best: Optional[Tuple[int, str]] = None
+        for match in _IRI_SEPARATOR_RE.finditer(rdf_type):
+            hit = self._iri_prefix_index.get(rdf_type[: match.end()])
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
 
-        return None
+        return best[1] if best is not None else None
 
     def resolve_fixture_iri(self, iri: str) -> Optional[str]:
         """
@@ -1100,12 +1227,19 @@ class RegistryResolver:
             abs_path: Absolute Path object
 
         Returns:
-            Repository-relative path string
-        """
-        try:
-            return str(abs_path.relative_to(self.root_dir))
-        except ValueError:
-            return str(abs_path)
+            Repository-relative path string, or the path itself if it lies
+            outside the repository
+        """
+        # Lexical like Path.relative_to, but a prefix test on the string
+        # forms: no exception is raised and caught for every outside path
+        path_str = str(abs_path)
+        root_str = str(self.root_dir)
+        if path_str == root_str:
+            return "."
+        root_prefix = os.path.join(root_str, "")
+        if path_str.startswith(root_prefix):
+            return path_str[len(root_prefix) :]
+        return path_str
 
     # =========================================================================
     # Discovery Methods
@@ -545,7 +545,7 @@ def generate_imports_catalog(
 
         # Add SHACL shapes if present, under the same {iri}/shapes convention the artifacts
         # catalog uses.  RegistryResolver already reads shapes from this catalog
-        # (_load_imports_shacl_entries) and loads them for data in the matching namespace, so
+        # (_parse_imports_catalog_entries) and loads them for data in the matching namespace, so
         # an imported vocabulary that ships shapes - the ASAM standards do - had a reader with
         # nothing to read until these entries were written.
         shacl_paths = files.get("shacl")
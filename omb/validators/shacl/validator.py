@@ -138,6 +138,10 @@ class ShaclValidator:
         self.allow_online = allow_online
         self.allow_warnings = allow_warnings
         self._context_url_map: Optional[Dict[str, "Path"]] = None
+        # Parsed ontology/SHACL graphs keyed by the exact tuple of source files.
+        # Schema files do not change during a run, and domains sharing the same
+        # schema footprint would otherwise re-parse identical Turtle each time.
+        self._schema_graph_cache: Dict[Tuple[Path, ...], Graph] = {}
 
         # Build context URL map from resolver's catalog
         self._build_context_url_map()
@@ -505,7 +509,7 @@ class ShaclValidator:
         # Load ontologies
         self._log(f"\n  Loading {len(all_ontology_paths)} ontology files:")
         ontology_files = [self.resolver.to_absolute(p) for p in all_ontology_paths]
-        ontology_graph = load_turtle_files(ontology_files, self.root_dir)
+        ontology_graph = self._load_schema_graph(ontology_files)
 
         for path in ontology_files:
             self._log(f"    {self._rel_path(path)}")
@@ -513,7 +517,7 @@ class ShaclValidator:
         # Load SHACL shapes
         self._log(f"\n  Loading {len(shacl_paths)} SHACL files:")
         shacl_files = [self.resolver.to_absolute(p) for p in shacl_paths]
-        shacl_graph = load_turtle_files(shacl_files, self.root_dir)
+        shacl_graph = self._load_schema_graph(shacl_files)
 
         for path in shacl_files:
             self._log(f"    {self._rel_path(path)}")
@@ -523,6 +527,19 @@ class ShaclValidator:
 
         return ontology_graph, shacl_graph
 
+    def _load_schema_graph(self, files: List[Path]) -> Graph:
+        """Load Turtle schema files, reusing the graph parsed for the same files.
+
+        The returned graph is shared between calls and must not be mutated;
+        inference and validation only ever copy it into new graphs.
+        """
+        key = tuple(files)
+        graph = self._schema_graph_cache.get(key)
+        if graph is None:
+            graph = load_turtle_files(files, self.root_dir)
+            self._schema_graph_cache[key] = graph
+        return graph
+
     def _routing_metadata(self, rdf_types, shacl_graph):
         """Compute shape/type-routing metadata for the report model.
 
@@ -8,14 +8,21 @@ It does NOT validate logical structure, SHACL compliance, or semantic correctnes
 API OVERVIEW:
 =============
 
-    check_json_wellformedness(paths, root_dir) -> (code, [(code, msg), ...])
-    check_turtle_wellformedness(paths, root_dir) -> (code, [(code, msg), ...])
-    check_all_wellformedness(paths, root_dir) -> (code, [(code, msg), ...])
+    check_json_wellformedness(paths, root_dir, jobs) -> (code, [(code, msg), ...])
+    check_turtle_wellformedness(paths, root_dir, jobs) -> (code, [(code, msg), ...])
+    check_all_wellformedness(paths, root_dir, jobs) -> (code, [(code, msg), ...])
+
+    iter_json_wellformedness(paths, root_dir, jobs) -> iterator of (code, msg)
+    iter_turtle_wellformedness(paths, root_dir, jobs) -> iterator of (code, msg)
+    iter_all_wellformedness(paths, root_dir, jobs) -> iterator of (format, code, msg)
 
 All functions accept either:
 - A single file path (str or Path)
 - A list of file paths and/or directories (recursively searched)
 
+Passing ``jobs > 1`` checks the whole batch on one bounded pool (threads for
+JSON, processes for Turtle).
+
 USAGE:
 ======
     from omb.validators.syntax_validator import (
@@ -36,7 +43,8 @@ USAGE:
 
 STANDALONE TESTING:
 ==================
-    python3 -m omb.validators.syntax_validator [--test] [--json] [--turtle] paths...
+    python3 -m omb.validators.syntax_validator [--test] [--json] [--turtle] \\
+        [--jobs N] paths...
 
 RETURN CODES:
 =============
@@ -48,15 +56,20 @@ import argparse
 import io
 import json
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Iterator, List, Optional, Tuple, Type, Union
 
 from rdflib import Graph
 from rdflib.exceptions import ParserError
 
+from omb.core.constants import Extensions
 from omb.core.result import ReturnCodes
 from omb.utils.file_collector import (
     PathsInput,
+    collect_files_by_extension,
     collect_jsonld_files,
     collect_turtle_files,
 )
@@ -113,14 +126,169 @@ def _check_single_turtle(
         return ReturnCodes.TURTLE_SYNTAX_ERROR, msg
 
 
+def _warm_turtle_worker() -> None:
+    """
+    Process-pool initializer: load rdflib's Turtle parser once per worker.
+
+    rdflib resolves parser plugins lazily on the first ``Graph.parse``; doing a
+    tiny parse here moves that import/registration cost out of the first task
+    each worker runs, so every real check hits an already-warm parser.
+    """
+    Graph().parse(data="<urn:omb:a> <urn:omb:b> <urn:omb:c> .", format="turtle")
+
+
+def _start_checks(
+    check: Callable[[str, Optional[Path]], Tuple[int, str]],
+    files: List[str],
+    root_dir: Optional[Path],
+    jobs: int,
+    executor_cls: Type[Executor],
+    stack: ExitStack,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Submit ``check(file, root_dir)`` for every file and return the result stream.
+
+    With ``jobs > 1`` all checks are submitted to a bounded pool immediately, so
+    several batches started on the same ``stack`` run concurrently instead of one
+    phase waiting for the other. Worker processes are long-lived for the whole
+    batch and warm rdflib's Turtle parser once at startup. The pool is shut down
+    (cancelling anything not yet started) when ``stack`` closes. With
+    ``jobs <= 1`` checks run lazily in-process as results are consumed.
+
+    Args:
+        check: Module-level single-file check function (picklable for processes)
+        files: File paths to check
+        root_dir: Optional root directory for path normalization in output
+        jobs: Maximum number of concurrent workers (1 = run in-process)
+        executor_cls: ProcessPoolExecutor or ThreadPoolExecutor
+        stack: ExitStack that owns the pool's lifetime
+
+    Returns:
+        Iterator of (code, message) tuples in input order
+    """
+    if jobs <= 1 or len(files) <= 1:
+        return (check(filename, root_dir) for filename in files)
+
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * 4))
+    if executor_cls is ProcessPoolExecutor:
+        executor = executor_cls(max_workers=workers, initializer=_warm_turtle_worker)
+    else:
+        executor = executor_cls(max_workers=workers)
+    stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+    return executor.map(check, files, repeat(root_dir), chunksize=chunksize)
+
+
+def _iter_checks(
+    check: Callable[[str, Optional[Path]], Tuple[int, str]],
+    files: List[str],
+    root_dir: Optional[Path] = None,
+    jobs: int = 1,
+    executor_cls: Type[Executor] = ProcessPoolExecutor,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield ``check(file, root_dir)`` for each file, in input order.
+
+    With ``jobs > 1`` the whole batch is handed to a single bounded pool, so
+    worker startup is paid once per worker rather than once per file. Turtle
+    parsing is CPU-bound and uses processes; JSON checks are dominated by file
+    I/O and use threads, avoiding process spawn and pickling for cheap work.
+    Results are consumed in input order, keeping output deterministic; pending
+    checks are cancelled if iteration stops early.
+
+    Args:
+        check: Module-level single-file check function (picklable for processes)
+        files: File paths to check
+        root_dir: Optional root directory for path normalization in output
+        jobs: Maximum number of concurrent workers (1 = run in-process)
+        executor_cls: ProcessPoolExecutor or ThreadPoolExecutor
+    """
+    with ExitStack() as stack:
+        yield from _start_checks(check, files, root_dir, jobs, executor_cls, stack)
+
+
 # =============================================================================
 # Public API
 # =============================================================================
 
 
+def iter_json_wellformedness(
+    paths: PathsInput,
+    root_dir: Optional[Path] = None,
+    jobs: int = 1,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Stream JSON/JSON-LD well-formedness results as each file is checked.
+
+    Same inputs and per-file ``(code, message)`` results as
+    ``check_json_wellformedness``, but nothing is buffered: callers can print
+    each result as soon as it is available and stop at the first failure,
+    which also cancels checks that have not started yet.
+
+    Args:
+        paths: File path(s) or directory path(s) to check
+        root_dir: Optional root directory for path normalization in output
+        jobs: Number of workers used to check files in parallel
+
+    Yields:
+        (code, message) tuple for each file, in collection order
+    """
+    files = collect_jsonld_files(paths, warn_on_invalid=True, return_pathlib=False)
+
+    if not files:
+        yield ReturnCodes.GENERAL_ERROR, "No JSON-LD files found to check."
+        return
+
+    files = [str(Path(filename).resolve()) for filename in files]
+    yield from _iter_checks(
+        _check_single_json, files, root_dir, jobs, ThreadPoolExecutor
+    )
+
+
+def iter_turtle_wellformedness(
+    paths: PathsInput,
+    root_dir: Optional[Path] = None,
+    jobs: int = 1,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Stream Turtle well-formedness results as each file is checked.
+
+    Streaming counterpart of ``check_turtle_wellformedness``; see
+    ``iter_json_wellformedness``.
+
+    Args:
+        paths: File path(s) or directory path(s) to check
+        root_dir: Optional root directory for path normalization in output
+        jobs: Number of worker processes used to check files in parallel
+
+    Yields:
+        (code, message) tuple for each file, in collection order
+    """
+    files = collect_turtle_files(paths, warn_on_invalid=True, return_pathlib=False)
+
+    if not files:
+        yield ReturnCodes.GENERAL_ERROR, "No Turtle files found to check."
+        return
+
+    files = [str(Path(filename).resolve()) for filename in files]
+    yield from _iter_checks(_check_single_turtle, files, root_dir, jobs)
+
+
+def _collect_results(
+    results: Iterator[Tuple[int, str]],
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """Drain a result stream into the ``(return_code, results)`` API shape."""
+    collected = list(results)
+    ret = 0
+    for code, _ in collected:
+        ret |= code
+    return ret, collected
+
+
 def check_json_wellformedness(
     paths: PathsInput,
     root_dir: Optional[Path] = None,
+    jobs: int = 1,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Check JSON/JSON-LD files for syntactic well-formedness.
@@ -131,33 +299,20 @@ def check_json_wellformedness(
     Args:
         paths: File path(s) or directory path(s) to check
         root_dir: Optional root directory for path normalization in output
+        jobs: Number of workers used to check files in parallel
 
     Returns:
         (return_code, results) tuple where:
         - return_code is 0 if all files are valid, non-zero otherwise
         - results is a list of (code, message) tuples for each file
     """
-    results = []
-    files = collect_jsonld_files(paths, warn_on_invalid=True, return_pathlib=False)
-
-    if not files:
-        msg = "No JSON-LD files found to check."
-        results.append((ReturnCodes.GENERAL_ERROR, msg))
-        return ReturnCodes.GENERAL_ERROR, results
-
-    ret = 0
-    for filename in files:
-        filename = str(Path(filename).resolve())
-        code, msg = _check_single_json(filename, root_dir)
-        results.append((code, msg))
-        ret |= code
-
-    return ret, results
+    return _collect_results(iter_json_wellformedness(paths, root_dir, jobs))
 
 
 def check_turtle_wellformedness(
     paths: PathsInput,
     root_dir: Optional[Path] = None,
+    jobs: int = 1,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Check Turtle files for syntactic well-formedness.
@@ -168,28 +323,92 @@ def check_turtle_wellformedness(
     Args:
         paths: File path(s) or directory path(s) to check
         root_dir: Optional root directory for path normalization in output
+        jobs: Number of worker processes used to check files in parallel
 
     Returns:
         (return_code, results) tuple where:
         - return_code is 0 if all files are valid, non-zero otherwise
         - results is a list of (code, message) tuples for each file
     """
-    results = []
-    files = collect_turtle_files(paths, warn_on_invalid=True, return_pathlib=False)
+    return _collect_results(iter_turtle_wellformedness(paths, root_dir, jobs))
 
-    if not files:
-        msg = "No Turtle files found to check."
-        results.append((ReturnCodes.GENERAL_ERROR, msg))
-        return ReturnCodes.GENERAL_ERROR, results
 
-    ret = 0
-    for filename in files:
-        filename = str(Path(filename).resolve())
-        code, msg = _check_single_turtle(filename, root_dir)
-        results.append((code, msg))
-        ret |= code
+def iter_all_wellformedness(
+    paths: PathsInput,
+    root_dir: Optional[Path] = None,
+    check_json: bool = True,
+    check_turtle: bool = True,
+    jobs: int = 1,
+) -> Iterator[Tuple[str, int, str]]:
+    """
+    Stream JSON-LD and Turtle well-formedness results from one fused pass.
+
+    The paths are walked once for both formats, and with ``jobs > 1`` the
+    JSON (thread pool) and Turtle (process pool) batches are submitted
+    together, so slow Turtle parsing overlaps the JSON checks instead of
+    waiting behind them. Results are yielded JSON first, then Turtle, each
+    tagged with its format so consumers never infer it from a result count.
+
+    Args:
+        paths: File path(s) or directory path(s) to check
+        root_dir: Optional root directory for path normalization in output
+        check_json: Whether to check JSON-LD files (default: True)
+        check_turtle: Whether to check Turtle files (default: True)
+        jobs: Number of workers used to check files in parallel
+
+    Yields:
+        (format, code, message) tuple for each file, where format is "json" or
+        "turtle"; a GENERAL_ERROR entry for each requested format without any
+        files
+    """
+    extensions = set()
+    if check_json:
+        extensions |= Extensions.JSONLD
+    if check_turtle:
+        extensions.add(Extensions.TURTLE)
+    if not extensions:
+        return
+
+    files = [
+        str(Path(filename).resolve())
+        for filename in collect_files_by_extension(
+            paths, extensions, warn_on_invalid=True, return_pathlib=False
+        )
+    ]
+    json_files = [f for f in files if Path(f).suffix in Extensions.JSONLD]
+    ttl_files = [f for f in files if Path(f).suffix == Extensions.TURTLE]
+
+    with ExitStack() as stack:
+        # Start the process pool first: forking after the JSON thread pool is
+        # running would copy a multi-threaded process into the workers.
+        ttl_results = _start_checks(
+            _check_single_turtle, ttl_files, root_dir, jobs, ProcessPoolExecutor, stack
+        )
+        json_results = _start_checks(
+            _check_single_json, json_files, root_dir, jobs, ThreadPoolExecutor, stack
+        )
 
-    return ret, results
+        if check_json:
+            if json_files:
+                for code, msg in json_results:
+                    yield "json", code, msg
+            else:
+                yield (
+                    "json",
+                    ReturnCodes.GENERAL_ERROR,
+                    "No JSON-LD files found to check.",
+                )
+
+        if check_turtle:
+            if ttl_files:
+                for code, msg in ttl_results:
+                    yield "turtle", code, msg
+            else:
+                yield (
+                    "turtle",
+                    ReturnCodes.GENERAL_ERROR,
+                    "No Turtle files found to check.",
+                )
 
 
 def check_all_wellformedness(
@@ -197,6 +416,7 @@ def check_all_wellformedness(
     root_dir: Optional[Path] = None,
     check_json: bool = True,
     check_turtle: bool = True,
+    jobs: int = 1,
 ) -> Tuple[int, List[Tuple[int, str]]]:
     """
     Check both JSON-LD and Turtle files for syntactic well-formedness.
@@ -206,24 +426,17 @@ def check_all_wellformedness(
         root_dir: Optional root directory for path normalization
         check_json: Whether to check JSON-LD files (default: True)
         check_turtle: Whether to check Turtle files (default: True)
+        jobs: Number of workers used to check files in parallel
 
     Returns:
         (return_code, results) tuple
     """
-    all_results = []
-    ret = 0
-
-    if check_json:
-        json_ret, json_results = check_json_wellformedness(paths, root_dir)
-        ret |= json_ret
-        all_results.extend(json_results)
-
-    if check_turtle:
-        turtle_ret, turtle_results = check_turtle_wellformedness(paths, root_dir)
-        ret |= turtle_ret
-        all_results.extend(turtle_results)
-
-    return ret, all_results
+    return _collect_results(
+        (code, msg)
+        for _, code, msg in iter_all_wellformedness(
+            paths, root_dir, check_json, check_turtle, jobs
+        )
+    )
 
 
 # =============================================================================
@@ -354,6 +567,14 @@ def main(args=None):
     parser.add_argument("--json", action="store_true", help="Check JSON-LD files only")
     parser.add_argument("--turtle", action="store_true", help="Check Turtle files only")
     parser.add_argument("--quiet", "-q", action="store_true", help="Only show errors")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes (default: 1)",
+    )
 
     parsed_args = parser.parse_args(args)
 
@@ -379,6 +600,7 @@ def main(args=None):
         root_dir=Path.cwd(),
         check_json=do_json,
         check_turtle=do_turtle,
+        jobs=parsed_args.jobs,
     )
 
     # Print results
@@ -62,6 +62,12 @@ ADDITIONAL OPTIONS:
       python3 -m omb.validators.validation_suite --data-paths ./my-data.json \\
           --artifacts ../other-repo/artifacts
 
+--jobs N
+    Number of worker processes used by check-syntax to parse files in parallel,
+    and of threads used to read data files during discovery and context files
+    of --artifacts directories (default: number of CPUs). Output order is
+    unchanged; use --jobs 1 to run every check in-process.
+
 VALIDATION PHASES (--run):
 =========================
 
@@ -114,7 +120,7 @@ import io
 import os
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from omb.core.paths import builtin_data_root
 from omb.utils.file_collector import discover_data_hierarchy
@@ -122,10 +128,7 @@ from omb.utils.print_formatter import normalize_path_for_display, normalize_text
 from omb.utils.registry_resolver import TEMP_DOMAIN_PREFIX, RegistryResolver
 from omb.validators.coherence_validator import validate_artifact_coherence
 from omb.validators.shacl.validator import ShaclValidator
-from omb.validators.syntax_validator import (
-    check_json_wellformedness,
-    check_turtle_wellformedness,
-)
+from omb.validators.syntax_validator import iter_all_wellformedness
 
 # Default root for OMB's built-in data. Functions accept root_dir as a
 # parameter; this is only the fallback. Single seam: builtin_data_root().
@@ -142,6 +145,22 @@ KNOWN_COHERENCE_ISSUES = {
 }
 
 
+def _group_known_issues_by_domain(
+    issues: Dict[Tuple[str, str], str],
+) -> Dict[str, Dict[str, str]]:
+    """Group known issues as domain -> {lowercase_class_name: issue URL}."""
+    grouped: Dict[str, Dict[str, str]] = {}
+    for (domain, cls), url in issues.items():
+        grouped.setdefault(domain, {})[cls] = url
+    return grouped
+
+
+# Built once at import so the per-domain loop is a dict lookup, not a rescan.
+_KNOWN_COHERENCE_ISSUES_BY_DOMAIN = _group_known_issues_by_domain(
+    KNOWN_COHERENCE_ISSUES
+)
+
+
 def get_resolver_root_dir(resolver: RegistryResolver | None) -> Path:
     """Return the active repository root for a resolver, falling back to ROOT_DIR."""
     candidate = getattr(resolver, "root_dir", ROOT_DIR) if resolver else ROOT_DIR
@@ -151,6 +170,7 @@ def get_resolver_root_dir(resolver: RegistryResolver | None) -> Path:
 def check_syntax_all(
     ontology_domains: List[str],
     resolver: RegistryResolver = None,
+    jobs: int = 1,
 ) -> int:
     """
     Check the syntax of all Turtle (.ttl) and JSON-LD (.json) files.
@@ -161,6 +181,7 @@ def check_syntax_all(
     Args:
         ontology_domains: List of domain names to check (used for filtering)
         resolver: Optional pre-configured RegistryResolver (with temporary entries)
+        jobs: Number of worker processes used to check files in parallel
 
     Returns:
         0 on success, non-zero on failure
@@ -196,27 +217,32 @@ def check_syntax_all(
     ]
     ttl_files_to_check = [str(p) for p in cataloged_files.get(".ttl", [])]
 
-    # Check JSON-LD files
-    for json_file in sorted(set(json_files_to_check)):
-        code, results = check_json_wellformedness(json_file, root_dir)
-        for c, msg in results:
-            if c != 0:
-                print(msg, file=sys.stderr)
-                return c
-            print(msg)
-
-    print("\n=== Checking TTL syntax ===", flush=True)
-
-    # Check TTL files
-    if ttl_files_to_check:
-        for ttl_file in sorted(set(ttl_files_to_check)):
-            code, results = check_turtle_wellformedness(ttl_file, root_dir)
-            for c, msg in results:
-                if c != 0:
-                    print(msg, file=sys.stderr)
-                    return c
-                print(msg)
-    else:
+    json_files = sorted(set(json_files_to_check))
+    ttl_files = sorted(set(ttl_files_to_check))
+
+    # Both formats go through one fused work queue: TTL parsing runs while the
+    # JSON-LD results are still being printed. Each result carries its format,
+    # so the TTL header is printed before the first Turtle result; the first
+    # failure closes the stream and cancels the remaining checks.
+    results = iter_all_wellformedness(
+        json_files + ttl_files,
+        root_dir,
+        check_json=bool(json_files),
+        check_turtle=bool(ttl_files),
+        jobs=jobs,
+    )
+    ttl_header_printed = False
+    for fmt, c, msg in results:
+        if fmt == "turtle" and not ttl_header_printed:
+            print("\n=== Checking TTL syntax ===", flush=True)
+            ttl_header_printed = True
+        if c != 0:
+            print(msg, file=sys.stderr)
+            return c
+        print(msg)
+
+    if not ttl_header_printed:
+        print("\n=== Checking TTL syntax ===", flush=True)
         print("  No TTL files in catalog to check")
 
     print("📌 Completed TTL and JSON syntax tests", flush=True)
@@ -291,10 +317,8 @@ def validate_data_conformance_all(
         # sharing loaded shapes + ontology closure. Correct for VC/DID documents
         # that legitimately reuse IRIs across files.
         if per_resource:
-            from pathlib import Path as _Path
-
             files = [
-                _Path(f)
+                Path(f)
                 for f in validator.resolver.get_test_files(domain, test_type="valid")
             ]
             if not files:
@@ -544,16 +568,11 @@ def validate_artifact_coherence_all(
     for domain in domains_to_check:
         print(f"\n🔍 Checking target classes for domain: {domain}", flush=True)
 
-        # Build known-issues set for this domain from KNOWN_COHERENCE_ISSUES
-        known_set = {
-            cls for (d, cls), url in KNOWN_COHERENCE_ISSUES.items() if d == domain
-        }
-        if known_set:
-            urls = [
-                url for (d, _), url in KNOWN_COHERENCE_ISSUES.items() if d == domain
-            ]
-            for url in urls:
-                print(f"  ⚠️  Known upstream issue: {url}", flush=True)
+        # Known-issues set for this domain from KNOWN_COHERENCE_ISSUES
+        known_issues = _KNOWN_COHERENCE_ISSUES_BY_DOMAIN.get(domain, {})
+        known_set = set(known_issues)
+        for url in known_issues.values():
+            print(f"  ⚠️  Known upstream issue: {url}", flush=True)
 
         # Call the validator with resolver
         returncode, output = validate_artifact_coherence(
@@ -580,18 +599,32 @@ def validate_artifact_coherence_all(
     return 0
 
 
+class CheckFailure(Exception):
+    """A check that cannot continue; carries the process exit code.
+
+    Raised instead of calling ``sys.exit`` inside subroutines so that only
+    ``main()`` decides when the process ends.
+    """
+
+    def __init__(self, message: str, return_code: int = 1):
+        super().__init__(message)
+        self.return_code = return_code
+
+
 def check_environment() -> None:
     """Enforce Python version and virtual environment requirements.
 
     Skips virtual-environment check when running in CI (``GITHUB_ACTIONS``
     env var set) or when ``--skip-env-check`` is passed.
+
+    Raises:
+        CheckFailure: If the interpreter or environment is unsupported
     """
     if sys.version_info < (3, 12):
-        print(
-            f"❌ Error: This project requires Python 3.12+. You are running {sys.version.split()[0]}.",
-            file=sys.stderr,
+        raise CheckFailure(
+            "❌ Error: This project requires Python 3.12+. "
+            f"You are running {sys.version.split()[0]}."
         )
-        sys.exit(1)
 
     in_venv = (
         (sys.prefix != sys.base_prefix)
@@ -600,18 +633,20 @@ def check_environment() -> None:
     )
 
     if not in_venv:
-        print(
-            "❌ Error: You are NOT running inside a virtual environment.",
-            file=sys.stderr,
+        raise CheckFailure(
+            "❌ Error: You are NOT running inside a virtual environment."
         )
-        sys.exit(1)
 
 
 # --- CLI / Main Logic ---
 def main():
     """Run validation checks based on arguments."""
 
-    check_environment()
+    try:
+        check_environment()
+    except CheckFailure as e:
+        print(e, file=sys.stderr)
+        sys.exit(e.return_code)
 
     # Argument Parsing
     # Use the module docstring (__doc__) as the description
@@ -725,6 +760,16 @@ def main():
         "against conformance and never recorded into a .expected snapshot.",
     )
 
+    target_group.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Number of workers for per-file syntax checks, data file "
+        "discovery and artifact registration (default: number of CPUs; "
+        "1 disables parallelism).",
+    )
+
     target_group.add_argument(
         "--per-resource",
         dest="per_resource",
@@ -761,7 +806,9 @@ def main():
             sys.exit(1)
 
         # Auto-discover top-level files and fixture mappings
-        top_level_files, iri_to_file, metadata = discover_data_hierarchy(valid_paths)
+        top_level_files, iri_to_file, metadata = discover_data_hierarchy(
+            valid_paths, jobs=args.jobs
+        )
 
         if not top_level_files:
             print("❌ Error: No top-level files found to validate.", file=sys.stderr)
@@ -792,7 +839,9 @@ def main():
             for ad in args.artifacts:
                 ad_path = Path(ad).resolve()
                 if ad_path.is_dir():
-                    registered = catalog_resolver.register_artifact_directory(ad_path)
+                    registered = catalog_resolver.register_artifact_directory(
+                        ad_path, jobs=args.jobs
+                    )
                     if registered:
                         artifact_dir_paths.append(ad_path)
                         print(
@@ -833,7 +882,9 @@ def main():
             for ad in args.artifacts:
                 ad_path = Path(ad).resolve()
                 if ad_path.is_dir():
-                    registered = catalog_resolver.register_artifact_directory(ad_path)
+                    registered = catalog_resolver.register_artifact_directory(
+                        ad_path, jobs=args.jobs
+                    )
                     if registered:
                         print(
                             f"📦 Registered artifact domains: {', '.join(registered)}",
@@ -901,7 +952,9 @@ def main():
         "check-syntax": [
             (
                 "Check Syntax",
-                lambda: check_syntax_all(ontology_domains, catalog_resolver),
+                lambda: check_syntax_all(
+                    ontology_domains, catalog_resolver, jobs=args.jobs
+                ),
             )
         ],
         "check-artifact-coherence": [
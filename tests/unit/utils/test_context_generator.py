@@ -16,10 +16,13 @@ from omb.utils.context_generator import (
     _analyze_or_branches,
     _build_ns_prefix_lookup,
     _lookup_prefix,
+    _parse_jsonld_ground,
+    _scan_owl,
     _sh_in_has_iris,
     extract_classes,
     extract_ontology_iri,
     extract_property_datatypes,
+    generate_all_contexts,
     generate_context,
 )
 
@@ -95,7 +98,8 @@ class TestExtractOntologyIri:
         g.add((ont_iri, RDF.type, OWL.Ontology))
 
         result = extract_ontology_iri(g)
-        assert result == str(ont_iri)
+        assert result == ont_iri
+        assert str(result) == "https://example.org/ontology/v1"
 
     def test_extract_ontology_iri_empty_graph_returns_none(self):
         """Should return None when no owl:Ontology found."""
@@ -429,6 +433,43 @@ class TestExtractClasses:
         assert len(result) == 0
 
 
+class TestScanOwl:
+    """Tests for the single-pass _scan_owl helper."""
+
+    def test_scan_owl_collects_iri_classes_and_imports(self):
+        """Should return ontology IRI, class IRIs and sorted imports."""
+        g = Graph()
+        onto = URIRef("https://example.org/test")
+        g.add((onto, RDF.type, OWL.Ontology))
+        g.add((onto, OWL.imports, URIRef("https://example.org/z")))
+        g.add((onto, OWL.imports, URIRef("https://example.org/a")))
+        g.add((URIRef("https://example.org/test/Foo"), RDF.type, OWL.Class))
+        g.add((URIRef("https://example.org/test/Bar"), RDF.type, RDFS.Class))
+
+        ontology_iri, class_iris, imports = _scan_owl(g)
+        assert ontology_iri == "https://example.org/test"
+        assert class_iris == {
+            "https://example.org/test/Foo",
+            "https://example.org/test/Bar",
+        }
+        assert imports == ["https://example.org/a", "https://example.org/z"]
+
+    def test_scan_owl_ignores_imports_of_other_subjects(self):
+        """Only owl:imports of the ontology declaration should be returned."""
+        g = Graph()
+        onto = URIRef("https://example.org/test")
+        g.add((onto, RDF.type, OWL.Ontology))
+        g.add((onto, OWL.imports, URIRef("https://example.org/a")))
+        g.add((URIRef("https://example.org/other"), OWL.imports, URIRef("urn:x")))
+
+        _, _, imports = _scan_owl(g)
+        assert imports == ["https://example.org/a"]
+
+    def test_scan_owl_empty_graph_returns_empty(self):
+        """Should return no IRI and no imports for an empty graph."""
+        assert _scan_owl(Graph()) == (None, set(), [])
+
+
 class TestAnalyzeOrBranches:
     """Tests for _analyze_or_branches function."""
 
@@ -514,6 +555,22 @@ class TestGenerateContext:
         result = generate_context("nonexistent_domain_xyz")
         assert result is None
 
+    def test_generate_context_empty_shacl_returns_none(self, tmp_path, monkeypatch):
+        """A SHACL file without any triples should abort generation."""
+        import omb.utils.context_generator as context_generator
+
+        domain_dir = tmp_path / "empty"
+        domain_dir.mkdir()
+        (domain_dir / "empty.owl.ttl").write_text(
+            "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            "<https://example.org/empty/> a owl:Ontology .\n",
+            encoding="utf-8",
+        )
+        (domain_dir / "empty.shacl.ttl").write_text("", encoding="utf-8")
+        monkeypatch.setattr(context_generator, "ARTIFACTS_DIR", tmp_path)
+
+        assert generate_context("empty") is None
+
     def test_generate_context_hdmap_has_or_properties_typed(self):
         """sh:or-based properties in hdmap should have @type: @id."""
         hdmap_owl = ARTIFACTS_DIR / "hdmap" / "hdmap.owl.ttl"
@@ -547,6 +604,29 @@ class TestGenerateContext:
         )
 
 
+class TestGenerateAllContexts:
+    """Tests for generate_all_contexts function."""
+
+    def test_parallel_generation_matches_serial(self, monkeypatch):
+        """jobs > 1 should write the same documents, in the same order."""
+        import omb.utils.context_generator as context_generator
+
+        written = []
+        monkeypatch.setattr(
+            context_generator,
+            "_write_context",
+            lambda domain, doc, dry_run=False: written.append((domain, doc)),
+        )
+
+        generate_all_contexts(exclude=["gx"], jobs=1)
+        serial = list(written)
+        written.clear()
+        generate_all_contexts(exclude=["gx"], jobs=2)
+
+        assert serial
+        assert written == serial
+
+
 class TestRoundTrip:
     """Tests for round-trip equivalence of verbose and compact instances."""
 
@@ -585,3 +665,88 @@ class TestRoundTrip:
         g_compact.parse(data=json.dumps(compact_instance), format="json-ld")
 
         assert isomorphic(g_verbose, g_compact), "Graphs should be isomorphic"
+
+    @pytest.mark.parametrize("nested", [False, True])
+    def test_context_roundtrip_manifest_instance_passes(self, tmp_path, nested):
+        """Ground and blank-node instances should both round-trip."""
+        # Imported via the module so pytest does not collect it as a test
+        import omb.utils.context_generator as context_generator
+
+        instance = {
+            "@context": {
+                "manifest": "https://w3id.org/ascs-ev/envited-x/manifest/v5/",
+                "xsd": "http://www.w3.org/2001/XMLSchema#",
+            },
+            "@id": "https://example.org/instance1",
+            "@type": "manifest:Manifest",
+            "manifest:filePath": {"@value": "data.txt", "@type": "xsd:anyURI"},
+        }
+        if nested:
+            # Node without @id becomes a blank node
+            instance["manifest:hasFileMetadata"] = {
+                "manifest:filePath": {"@value": "other.txt", "@type": "xsd:anyURI"}
+            }
+        instance_path = tmp_path / "instance.json"
+        instance_path.write_text(json.dumps(instance), encoding="utf-8")
+
+        assert context_generator.test_context_roundtrip("manifest", instance_path)
+
+    def test_context_roundtrip_pass_is_confirmed_by_rdflib(self, tmp_path, monkeypatch):
+        """Equal native quads alone must not pass; rdflib decides success."""
+        import omb.utils.context_generator as context_generator
+
+        instance = {
+            "@context": {"manifest": "https://w3id.org/ascs-ev/envited-x/manifest/v5/"},
+            "@id": "https://example.org/instance1",
+            "@type": "manifest:Manifest",
+        }
+        instance_path = tmp_path / "instance.json"
+        instance_path.write_text(json.dumps(instance), encoding="utf-8")
+
+        parsed = []
+
+        class RecordingGraph(Graph):
+            def parse(self, *args, **kwargs):
+                parsed.append(kwargs.get("format"))
+                return super().parse(*args, **kwargs)
+
+        monkeypatch.setattr(context_generator, "_parse_jsonld_ground", lambda d: {1})
+        monkeypatch.setattr(context_generator, "Graph", RecordingGraph)
+
+        assert context_generator.test_context_roundtrip("manifest", instance_path)
+        assert parsed == ["json-ld", "json-ld"]
+
+    def test_context_roundtrip_native_mismatch_fails_fast(self, tmp_path, monkeypatch):
+        """Differing native quads fail without building rdflib graphs."""
+        import omb.utils.context_generator as context_generator
+
+        instance_path = tmp_path / "instance.json"
+        instance_path.write_text(json.dumps({"@id": "urn:a"}), encoding="utf-8")
+
+        results = iter([{1}, {2}])
+        monkeypatch.setattr(
+            context_generator, "_parse_jsonld_ground", lambda d: next(results)
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rdflib should not be needed")
+
+        monkeypatch.setattr(context_generator, "Graph", fail)
+
+        assert not context_generator.test_context_roundtrip("manifest", instance_path)
+
+    def test_parse_jsonld_ground_needs_inline_ground_document(self):
+        """Only self-contained documents without blank nodes parse natively."""
+        pytest.importorskip("pyoxigraph")
+        ground = {
+            "@context": {"ex": "https://example.org/"},
+            "@id": "ex:a",
+            "ex:name": "A",
+        }
+        assert len(_parse_jsonld_ground(ground)) == 1
+
+        nested = {**ground, "ex:child": {"ex:name": "B"}}
+        assert _parse_jsonld_ground(nested) is None
+
+        remote = {**ground, "@context": "https://example.org/context.jsonld"}
+        assert _parse_jsonld_ground(remote) is None
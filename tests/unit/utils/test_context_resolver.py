@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 """Tests for local JSON-LD context resolution."""
 
+import json
+import os
 from pathlib import Path
 
-from omb.utils.context_resolver import build_context_url_map
+import omb.utils.context_resolver as context_resolver
+from omb.utils.context_resolver import (
+    _apply_uri_tweaks,
+    _collect_unresolved_context_urls,
+    _load_and_tweak_context,
+    build_context_url_map,
+    discover_context_files,
+    inline_jsonld_with_local_contexts,
+    load_jsonld_with_local_contexts,
+)
 from omb.utils.registry_resolver import RegistryResolver
 
 
@@ -19,3 +30,172 @@ def test_build_context_url_map_includes_schema_shared_w3c_contexts(root_dir: Pat
 
     assert url_map["http://www.w3.org/2006/vcard/ns#"] == schema_context_path
     assert url_map["http://www.w3.org/ns/dcat#"] == schema_context_path
+
+
+def test_apply_uri_tweaks_replaces_all_sources_in_one_pass():
+    """Several tweaks are applied together, preferring the longest source."""
+    tweaks = {
+        "http://schema.org/": "https://schema.org/",
+        "https://w3id.org/gaia-x/development#": "https://w3id.org/gaia-x/development/",
+        "https://w3id.org/gaia-x/": "urn:gx:",
+    }
+    text = (
+        '{"a": "http://schema.org/name", '
+        '"b": "https://w3id.org/gaia-x/development#Issuer"}'
+    )
+
+    assert _apply_uri_tweaks(text, tweaks) == (
+        '{"a": "https://schema.org/name", '
+        '"b": "https://w3id.org/gaia-x/development/Issuer"}'
+    )
+
+
+def test_apply_uri_tweaks_without_tweaks_returns_text():
+    """No tweaks leave the text untouched."""
+    assert _apply_uri_tweaks("http://schema.org/", {}) == "http://schema.org/"
+
+
+def test_load_and_tweak_context_reuses_until_file_changes(tmp_path: Path):
+    """Repeated loads share one parse; a newer file version is re-read."""
+    ctx_file = tmp_path / "a.context.jsonld"
+    ctx_file.write_text(json.dumps({"@context": {"s": "http://schema.org/"}}))
+    tweaks = {"http://schema.org/": "https://schema.org/"}
+
+    first = _load_and_tweak_context(ctx_file, tweaks)
+    assert first == {"s": "https://schema.org/"}
+    assert _load_and_tweak_context(ctx_file, tweaks) is first
+
+    ctx_file.write_text(json.dumps({"@context": {"t": "http://schema.org/"}}))
+    stat = ctx_file.stat()
+    os.utime(ctx_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _load_and_tweak_context(ctx_file, tweaks) == {"t": "https://schema.org/"}
+
+
+def test_inline_contexts_copies_nested_dicts_and_lists(tmp_path: Path):
+    """Nested @context references are inlined without touching the input."""
+    ctx_file = tmp_path / "a.context.jsonld"
+    ctx_file.write_text(json.dumps({"@context": {"ex": "http://example.org/"}}))
+    url_map = {"https://example.org/a/context": ctx_file}
+
+    data = {
+        "@context": "https://example.org/a/context",
+        "items": [
+            {"@context": ["https://example.org/a/context", {"x": "ex:x"}]},
+            [1, {"nested": {"@context": "https://remote.example/ctx"}}],
+            "plain",
+        ],
+    }
+
+    result = json.loads(inline_jsonld_with_local_contexts(data, url_map))
+
+    assert result == {
+        "@context": {"ex": "http://example.org/"},
+        "items": [
+            {"@context": [{"ex": "http://example.org/"}, {"x": "ex:x"}]},
+            [1, {"nested": {"@context": "https://remote.example/ctx"}}],
+            "plain",
+        ],
+    }
+    assert data["@context"] == "https://example.org/a/context"
+    assert _collect_unresolved_context_urls(result, url_map) == [
+        "https://remote.example/ctx"
+    ]
+
+
+def test_load_jsonld_matches_inlining_loaded_data(tmp_path: Path):
+    """Loading from disk inlines the same contexts as the in-memory path."""
+    ctx_file = tmp_path / "a.context.jsonld"
+    ctx_file.write_text(json.dumps({"@context": {"ex": "http://schema.org/"}}))
+    url_map = {"https://example.org/a/context": ctx_file}
+
+    data = {
+        "@context": "https://example.org/a/context",
+        "@graph": [
+            {"@context": ["https://example.org/a/context"], "@id": "ex:a"},
+            [{"nested": {"@context": "https://example.org/a/context"}}],
+        ],
+    }
+    instance = tmp_path / "instance.json"
+    instance.write_text(json.dumps(data))
+
+    loaded = load_jsonld_with_local_contexts(instance, url_map)
+
+    assert loaded == inline_jsonld_with_local_contexts(data, url_map)
+    assert json.loads(loaded)["@context"] == {"ex": "https://schema.org/"}
+
+
+def test_load_jsonld_top_level_context_only(tmp_path: Path, caplog):
+    """A lone top-level @context is inlined and checked without a tree walk."""
+    ctx_file = tmp_path / "a.context.jsonld"
+    ctx_file.write_text(json.dumps({"@context": {"ex": "http://example.org/"}}))
+    url_map = {"https://example.org/a/context": ctx_file}
+
+    data = {
+        "@context": ["https://example.org/a/context", "https://remote.example/ctx"],
+        "@graph": [{"@id": "ex:a", "ex:label": "no nested contexts here"}],
+    }
+    instance = tmp_path / "instance.json"
+    instance.write_text(json.dumps(data))
+
+    loaded = load_jsonld_with_local_contexts(instance, url_map)
+
+    assert loaded == inline_jsonld_with_local_contexts(data, url_map)
+    assert json.loads(loaded)["@context"][0] == {"ex": "http://example.org/"}
+    assert "https://remote.example/ctx" in caplog.text
+
+
+def test_discover_context_files_prunes_vcs_and_cache_dirs(tmp_path: Path):
+    """Contexts under VCS or tooling directories are not mapped; other
+    dot-directories such as .well-known/ are still searched."""
+    doc = json.dumps({"@context": {"@vocab": "https://example.org/a/"}})
+    for rel in (
+        "a/a.context.jsonld",
+        ".well-known/w.context.jsonld",
+        ".git/b.context.jsonld",
+        "node_modules/c/c.context.jsonld",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True)
+        path.write_text(doc.replace("/a/", f"/{path.stem.split('.')[0]}/"))
+
+    url_map = discover_context_files([tmp_path])
+
+    assert (
+        url_map["https://example.org/a/"]
+        == (tmp_path / "a" / "a.context.jsonld").resolve()
+    )
+    assert set(url_map.values()) == {
+        (tmp_path / "a" / "a.context.jsonld").resolve(),
+        (tmp_path / ".well-known" / "w.context.jsonld").resolve(),
+    }
+
+
+def test_inline_contexts_resolves_repeated_url_once(tmp_path: Path, monkeypatch):
+    """A context URL repeated across embedded nodes is loaded once per walk."""
+    ctx_file = tmp_path / "a.context.jsonld"
+    ctx_file.write_text(json.dumps({"@context": {"ex": "http://example.org/"}}))
+    url_map = {"https://example.org/a/context": ctx_file}
+
+    loads = []
+    original = context_resolver._load_and_tweak_context
+
+    def counting_load(path, tweaks):
+        loads.append(path)
+        return original(path, tweaks)
+
+    monkeypatch.setattr(context_resolver, "_load_and_tweak_context", counting_load)
+
+    data = {
+        "@context": "https://example.org/a/context",
+        "@graph": [
+            {"@context": "https://example.org/a/context", "@id": f"ex:{i}"}
+            for i in range(3)
+        ],
+    }
+    result = json.loads(inline_jsonld_with_local_contexts(data, url_map))
+
+    assert loads == [ctx_file]
+    assert all(
+        node["@context"] == {"ex": "http://example.org/"} for node in result["@graph"]
+    )
@@ -10,12 +10,14 @@ Tests file collection utilities including:
 - collect_ontology_files
 - collect_test_files
 - collect_ontology_bundles
+- write_if_changed
 """
 
 from pathlib import Path
 
 import pytest  # noqa: F401
 
+import omb.utils.file_collector as file_collector
 from omb.utils.file_collector import (
     collect_files_by_extension,
     collect_files_by_pattern,
@@ -26,6 +28,8 @@ from omb.utils.file_collector import (
     collect_turtle_files,
     discover_data_hierarchy,
     extract_jsonld_iris,
+    iter_files_by_extension,
+    write_if_changed,
 )
 
 
@@ -72,6 +76,36 @@ class TestCollectFilesByExtension:
 
         assert len(result) == 2
 
+    def test_directory_walk_matches_rglob_order(self, temp_dir):
+        """Nested results come in rglob order; symlinked dirs are not followed."""
+        for rel in ("top.json", "a/x.json", "a/b/y.json", "a/b/c/z.json", "d/w.json"):
+            (temp_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+            (temp_dir / rel).write_text("{}")
+        (temp_dir / "a" / ".hidden.json").write_text("{}")
+        (temp_dir / "a" / "notes.txt").write_text("")
+        (temp_dir / "a" / "link").symlink_to(temp_dir / "d", target_is_directory=True)
+
+        result = collect_files_by_extension([temp_dir], ".json")
+
+        root = temp_dir.resolve()
+        expected = [
+            str(p) for p in root.rglob("*") if p.is_file() and p.suffix == ".json"
+        ]
+        assert result == expected
+        assert len(result) == 6
+
+    def test_prunes_vcs_and_cache_dirs(self, temp_dir):
+        """Tool directories are skipped; other dot directories are walked."""
+        for sub in (".git", "node_modules", "__pycache__", ".well-known", "data"):
+            (temp_dir / sub).mkdir()
+            (temp_dir / sub / "doc.json").write_text("{}")
+
+        result = collect_files_by_extension(temp_dir, ".json", return_pathlib=True)
+        assert sorted(f.parent.name for f in result) == [".well-known", "data"]
+
+        result = collect_files_by_extension(temp_dir, ".json", prune_dirs=set())
+        assert len(result) == 5
+
     def test_single_file_input(self, temp_dir):
         """Test with a single file as input."""
         file_path = temp_dir / "single.ttl"
@@ -135,6 +169,40 @@ class TestCollectFilesByExtension:
         assert "Warning" in captured.err
 
 
+class TestIterFilesByExtension:
+    """Tests for iter_files_by_extension function."""
+
+    def test_matches_collect_order(self, temp_dir):
+        """Yields the same files, in the same order, as the list variant."""
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "b.ttl").write_text("")
+        (temp_dir / "sub" / "a.ttl").write_text("")
+        (temp_dir / "c.json").write_text("{}")
+
+        assert list(iter_files_by_extension(temp_dir, ".ttl")) == (
+            collect_files_by_extension(temp_dir, ".ttl")
+        )
+
+    def test_stops_walking_when_consumer_stops(self, temp_dir, monkeypatch):
+        """Taking the first match does not scan the remaining directories."""
+        for i in range(3):
+            (temp_dir / f"d{i}").mkdir()
+            (temp_dir / f"d{i}" / "x.ttl").write_text("")
+        scanned = []
+        real_scan = file_collector._scan_dir
+
+        def counting_scan(directory, prune_dirs):
+            scanned.append(directory)
+            return real_scan(directory, prune_dirs)
+
+        monkeypatch.setattr(file_collector, "_scan_dir", counting_scan)
+
+        first = next(iter_files_by_extension(temp_dir, ".ttl"))
+
+        assert first.endswith("x.ttl")
+        assert len(scanned) == 2  # the root and the first subdirectory
+
+
 class TestCollectTurtleFiles:
     """Tests for collect_turtle_files convenience function."""
 
@@ -190,6 +258,20 @@ class TestCollectFilesByPattern:
 
         assert len(result) == 2
 
+    def test_literal_pattern(self, temp_dir):
+        """A pattern without wildcards matches exactly that file."""
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        (subdir / "PROPERTIES.md").write_text("")
+        (subdir / "other.md").write_text("")
+
+        assert collect_files_by_pattern([temp_dir], "subdir/PROPERTIES.md") == [
+            str((subdir / "PROPERTIES.md").resolve())
+        ]
+        assert collect_files_by_pattern([temp_dir], "PROPERTIES.md") == []
+        # Directories never match
+        assert collect_files_by_pattern([temp_dir], "subdir") == []
+
 
 class TestCollectOntologyFiles:
     """Tests for collect_ontology_files function."""
@@ -311,6 +393,20 @@ class TestCollectOntologyBundles:
         assert "manifest" in result
         assert result["manifest"]["instance"] is not None
 
+    def test_instance_falls_back_to_any_instance_file(self, temp_dir):
+        """Without {domain}_instance.json, another *_instance.json is used."""
+        artifacts_dir = temp_dir / "artifacts"
+        (artifacts_dir / "manifest").mkdir(parents=True)
+        (artifacts_dir / "manifest" / "manifest.owl.ttl").write_text("")
+        valid_dir = temp_dir / "tests" / "manifest" / "valid"
+        valid_dir.mkdir(parents=True)
+        (valid_dir / "other_instance.json").write_text("{}")
+        (valid_dir / "notes.json").write_text("{}")
+
+        result = collect_ontology_bundles(artifacts_dir, temp_dir / "tests")
+
+        assert result["manifest"]["instance"].name == "other_instance.json"
+
     def test_nonexistent_base_dir(self, temp_dir, capsys):
         """Test with nonexistent base directory."""
         result = collect_ontology_bundles(temp_dir / "nonexistent")
@@ -320,6 +416,45 @@ class TestCollectOntologyBundles:
         assert "Warning" in captured.err
 
 
+class TestWriteIfChanged:
+    """Tests for write_if_changed function."""
+
+    def test_writes_new_file(self, temp_dir):
+        """Missing files are created, including parent directories."""
+        file = temp_dir / "sub" / "out.json"
+        assert write_if_changed(file, "{}\n") is True
+        assert file.read_text(encoding="utf-8") == "{}\n"
+
+    def test_identical_content_not_rewritten(self, temp_dir):
+        """Byte-identical content is reported as unchanged."""
+        file = temp_dir / "out.json"
+        file.write_bytes('{"name": "Ä"}\n'.encode("utf-8"))
+        assert write_if_changed(file, '{"name": "Ä"}\n') is False
+
+    def test_crlf_only_difference_not_rewritten(self, temp_dir):
+        """Differences in line endings alone do not trigger a write."""
+        file = temp_dir / "out.json"
+        file.write_bytes(b"{\r\n}\r\n")
+        assert write_if_changed(file, "{\n}\n") is False
+        assert file.read_bytes() == b"{\r\n}\r\n"
+
+    def test_changed_content_rewritten_with_lf(self, temp_dir):
+        """Changed content is written with LF line endings."""
+        file = temp_dir / "out.json"
+        file.write_bytes(b"{}\r\n")
+        assert write_if_changed(file, '{"a": 1}\n') is True
+        assert file.read_bytes() == b'{"a": 1}\n'
+
+    def test_crlf_split_across_chunks_not_rewritten(self, temp_dir, monkeypatch):
+        """A CRLF pair straddling a read boundary still compares equal."""
+        monkeypatch.setattr(file_collector, "_COMPARE_CHUNK_SIZE", 4)
+        file = temp_dir / "out.json"
+        file.write_bytes(b"abc\r\nd\r\r\n")
+        assert write_if_changed(file, "abc\nd\n\n") is False
+        assert write_if_changed(file, "abc\nd\n\nx") is True
+        assert file.read_bytes() == b"abc\nd\n\nx"
+
+
 class TestExtractJsonldIris:
     """Tests for extract_jsonld_iris function."""
 
@@ -398,6 +533,32 @@ class TestExtractJsonldIris:
         assert "did:web:example.com:item1" in refs
         assert "did:web:example.com:item2" in refs
 
+    def test_reuses_result_until_file_changes(self, temp_dir, monkeypatch):
+        """Unchanged files are not re-parsed; edits are picked up."""
+        file = temp_dir / "test.json"
+        file.write_text('{"@id": "urn:a", "ref": {"@id": "urn:b"}}')
+        _, refs = extract_jsonld_iris(file)
+        refs.add("urn:mutated")
+
+        parsed = []
+        original_read = Path.read_bytes
+
+        def counting_read(self):
+            parsed.append(self)
+            return original_read(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read)
+
+        assert extract_jsonld_iris(file) == ("urn:a", {"urn:b"})
+        assert parsed == []
+
+        cache_size = len(file_collector._IRI_CACHE)
+        file.write_text('{"@id": "urn:changed"}')
+        assert extract_jsonld_iris(file) == ("urn:changed", set())
+        assert parsed == [file]
+        # The edit replaced the cached entry instead of adding a second one
+        assert len(file_collector._IRI_CACHE) == cache_size
+
 
 class TestDiscoverDataHierarchy:
     """Tests for discover_data_hierarchy function."""
@@ -643,3 +804,34 @@ class TestDiscoverDataHierarchy:
 
         assert len(top_level) == 2  # Only credentials
         assert metadata["fixture_count"] == 3  # 3 DID documents
+
+    def test_threaded_discovery_matches_sequential(self, temp_dir):
+        """Parallel IRI extraction yields the same result as in-process."""
+        for i in range(6):
+            (temp_dir / f"cred{i}.json").write_text(f'{{"@id": "urn:uuid:dup{i % 2}"}}')
+            (temp_dir / f"party{i}-did.json").write_text(f'{{"@id": "did:web:p{i}"}}')
+
+        assert discover_data_hierarchy([temp_dir], jobs=4) == discover_data_hierarchy(
+            [temp_dir]
+        )
+
+    def test_overlapping_paths_scan_each_directory_once(self, temp_dir, monkeypatch):
+        """A directory nested in another input is not walked a second time."""
+        sub = temp_dir / "sub"
+        sub.mkdir()
+        (temp_dir / "a.json").write_text('{"@id": "urn:uuid:a"}')
+        (sub / "b.json").write_text('{"@id": "urn:uuid:b"}')
+        expected = discover_data_hierarchy([temp_dir])
+        scanned = []
+        real_scan = file_collector._scan_dir
+
+        def counting_scan(directory, prune_dirs):
+            scanned.append(directory)
+            return real_scan(directory, prune_dirs)
+
+        monkeypatch.setattr(file_collector, "_scan_dir", counting_scan)
+
+        result = discover_data_hierarchy([temp_dir, sub, sub / "b.json"])
+
+        assert result == expected
+        assert sorted(scanned) == sorted({str(temp_dir.resolve()), str(sub.resolve())})
@@ -8,7 +8,7 @@ import os
 from pathlib import Path
 
 import pytest
-from rdflib import Graph, URIRef
+from rdflib import OWL, RDF, Graph, URIRef
 
 from omb.utils import graph_loader
 from omb.utils.registry_resolver import RegistryResolver
@@ -87,6 +87,23 @@ def test_load_turtle_files_invalid_turtle_raises_runtime_error(temp_dir: Path):
         graph_loader.load_turtle_files([ttl_file], temp_dir)
 
 
+def test_load_turtle_predicates_keeps_only_requested_predicates(temp_dir: Path):
+    ttl_file = temp_dir / "data.ttl"
+    ttl_file.write_text(
+        "@prefix ex: <http://example.org/> .\n"
+        "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        'ex:a a owl:Class ; ex:label "A"@en ; ex:count 3 .\n'
+        "[] a ex:Anon .\n"
+    )
+
+    g = graph_loader.load_turtle_predicates(ttl_file, [RDF.type])
+
+    assert len(g) == 2
+    assert (URIRef("http://example.org/a"), RDF.type, OWL.Class) in g
+    assert not list(g.triples((None, URIRef("http://example.org/label"), None)))
+    assert dict(g.namespaces())["ex"] == URIRef("http://example.org/")
+
+
 def test_load_jsonld_files_with_context_map_uses_public_id_when_cwd_unavailable(
     temp_dir: Path, monkeypatch: pytest.MonkeyPatch
 ):
@@ -5,6 +5,7 @@ Unit tests for omb.utils.registry_resolver catalog resolution.
 
 import json
 import logging
+import weakref
 from pathlib import Path
 
 from omb.utils.registry_resolver import RegistryResolver
@@ -111,6 +112,32 @@ def test_artifacts_catalog_drives_domain_resolution(temp_dir):
     )
 
 
+def test_resolve_type_to_domain_prefix_matches(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="http://example.org/demo/v1/" uri="demo/demo.owl.ttl"/>
+  <uri name="http://example.org/hash#" uri="hash/hash.owl.ttl"/>
+  <uri name="http://example.org/demo/v1/sub/" uri="sub/sub.owl.ttl"/>
+</catalog>
+""",
+    )
+
+    resolver = RegistryResolver(temp_dir)
+
+    assert resolver.resolve_type_to_domain("http://example.org/demo/v1") == "demo"
+    assert resolver.resolve_type_to_domain("http://example.org/hash#Thing") == "hash"
+    assert resolver.resolve_type_to_domain("http://example.org/sub/Thing") is None
+    assert resolver.resolve_type_to_domain("http://example.org/demo/v1X") is None
+    # Nested namespaces resolve to the first registered IRI, as before
+    assert (
+        resolver.resolve_type_to_domain("http://example.org/demo/v1/sub/Thing")
+        == "demo"
+    )
+
+
 def test_base_ontology_filtering_by_iris(temp_dir):
     registry = {
         "version": "1.0.0",
@@ -300,3 +327,152 @@ def test_register_artifact_directory_logs_invalid_context_warning(temp_dir, capl
         "Could not extract IRI from context" in record.message
         for record in caplog.records
     )
+
+
+def test_test_catalog_is_loaded_on_first_use(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog"></catalog>
+""",
+    )
+    tests_catalog = temp_dir / "tests" / "catalog-v001.xml"
+    tests_catalog.parent.mkdir(parents=True)
+    tests_catalog.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="did:web:example.org:issuer" uri="tests/fixtures/issuer-did.json"
+       category="fixture"/>
+</catalog>
+"""
+    )
+
+    resolver = RegistryResolver(temp_dir)
+    assert resolver._test_catalog is None
+
+    resolver.register_fixture_mappings(
+        {"did:web:example.org:holder": temp_dir / "holder-did.json"}
+    )
+
+    assert resolver.resolve_fixture_iri("did:web:example.org:issuer") == (
+        "tests/fixtures/issuer-did.json"
+    )
+    assert resolver.resolve_fixture_iri("did:web:example.org:holder") is not None
+    assert resolver.is_catalog_loaded()
+
+
+def test_catalog_without_namespace_is_read(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog>
+  <uri name="https://example.org/plain/v1/" uri="plain/plain.owl.ttl"/>
+  <uri name="https://example.org/plain/v1/shapes" uri="plain/plain.shacl.ttl"/>
+</catalog>
+""",
+    )
+
+    resolver = RegistryResolver(temp_dir)
+
+    assert resolver.get_ontology_path("plain") == "artifacts/plain/plain.owl.ttl"
+    assert resolver.get_shacl_paths("plain") == ["artifacts/plain/plain.shacl.ttl"]
+
+
+def test_temporary_entries_visible_after_index_built(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog"></catalog>
+""",
+    )
+    data_file = temp_dir / "data" / "instance.json"
+    data_file.parent.mkdir()
+    data_file.write_text("{}")
+
+    resolver = RegistryResolver(temp_dir)
+    assert resolver.get_test_domains() == []
+
+    resolver.add_temporary_test_entries("custom", [data_file])
+
+    assert resolver.get_test_domains() == ["custom"]
+    assert resolver.get_test_files("custom", test_type="valid") == [data_file]
+
+
+def test_get_all_cataloged_files_skips_missing_and_dangling(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog"></catalog>
+""",
+    )
+    (temp_dir / "tests").mkdir()
+    (temp_dir / "tests" / "catalog-v001.xml").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+  <uri name="urn:a" uri="data/present.json" domain="d" category="test-data"/>
+  <uri name="urn:b" uri="data/linked.json" domain="d" category="test-data"/>
+  <uri name="urn:c" uri="data/dangling.json" domain="d" category="test-data"/>
+  <uri name="urn:d" uri="data/missing.json" domain="d" category="test-data"/>
+  <uri name="urn:e" uri="nodir/missing.json" domain="d" category="test-data"/>
+</catalog>
+"""
+    )
+    data_dir = temp_dir / "data"
+    data_dir.mkdir()
+    (data_dir / "present.json").write_text("{}")
+    (data_dir / "linked.json").symlink_to(data_dir / "present.json")
+    (data_dir / "dangling.json").symlink_to(data_dir / "gone.json")
+
+    files = RegistryResolver(temp_dir).get_all_cataloged_files()
+
+    assert files == {".json": [data_dir / "linked.json", data_dir / "present.json"]}
+
+
+def test_register_artifact_directory_threaded_matches_sequential(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog"></catalog>
+""",
+    )
+
+    ext_artifacts = temp_dir / "external-artifacts"
+    for i in range(5):
+        domain = f"dom{i}"
+        domain_dir = ext_artifacts / domain
+        domain_dir.mkdir(parents=True)
+        (domain_dir / f"{domain}.owl.ttl").write_text("")
+        if i != 2:
+            context = {"@context": {"@vocab": f"https://example.org/{domain}/v1/"}}
+            (domain_dir / f"{domain}.context.jsonld").write_text(json.dumps(context))
+
+    sequential = RegistryResolver(temp_dir)
+    threaded = RegistryResolver(temp_dir)
+
+    assert sequential.register_artifact_directory(ext_artifacts) == [
+        f"dom{i}" for i in range(5)
+    ]
+    assert threaded.register_artifact_directory(ext_artifacts, jobs=4) == [
+        f"dom{i}" for i in range(5)
+    ]
+    assert threaded._domain_iris == sequential._domain_iris
+    assert "dom2" not in threaded._domain_iris
+    assert threaded.resolve_type_to_domain("https://example.org/dom3/v1/X") == "dom3"
+
+
+def test_resolver_supports_weak_references(temp_dir):
+    _write_registry(temp_dir, {"version": "1.0.0", "ontologies": {}})
+    _write_artifacts_catalog(
+        temp_dir,
+        """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog"></catalog>
+""",
+    )
+    resolver = RegistryResolver(temp_dir)
+
+    assert weakref.ref(resolver)() is resolver
@@ -55,6 +55,27 @@ def test_apply_inference_rdfs_adds_inferred(tmp_path: Path):
     assert inferred >= 1
 
 
+def test_load_schema_graph_same_files_parses_once(monkeypatch, tmp_path: Path):
+    validator = _make_validator(tmp_path)
+    shapes = tmp_path / "a.shacl.ttl"
+    shapes.write_text("<http://example.org/s> a <http://example.org/T> .")
+
+    calls = []
+    real_load = shacl_validator_module.load_turtle_files
+
+    def counting_load(files, root_dir):
+        calls.append(tuple(files))
+        return real_load(files, root_dir)
+
+    monkeypatch.setattr(shacl_validator_module, "load_turtle_files", counting_load)
+
+    first = validator._load_schema_graph([shapes])
+    second = validator._load_schema_graph([shapes])
+    assert first is second
+    assert len(first) == 1
+    assert calls == [(shapes,)]
+
+
 def test_validate_data_conformance_registers_artifact_dirs(monkeypatch, temp_dir: Path):
     """Wrapper entrypoint registers artifact directories via resolver."""
     root = temp_dir / "repo"
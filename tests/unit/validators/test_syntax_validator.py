@@ -70,3 +70,70 @@ def test_check_all_wellformedness_multiple_files(temp_dir: Path):
     code, results = syntax_validator.check_all_wellformedness(temp_dir)
     assert code == ReturnCodes.SUCCESS
     assert len(results) == 2  # One JSON, one TTL
+
+
+def test_check_turtle_wellformedness_parallel_jobs_keeps_order(temp_dir: Path):
+    """Batched checks on a process pool report results in input order."""
+    names = ["a.ttl", "b.ttl", "c.ttl"]
+    for name in names:
+        (temp_dir / name).write_text("<http://ex.org/a> a <http://ex.org/B> .")
+    (temp_dir / "b.ttl").write_text("not turtle")
+
+    code, results = syntax_validator.check_turtle_wellformedness(
+        [temp_dir / name for name in names], jobs=2
+    )
+    assert code == ReturnCodes.TURTLE_SYNTAX_ERROR
+    assert [c for c, _ in results] == [
+        ReturnCodes.SUCCESS,
+        ReturnCodes.TURTLE_SYNTAX_ERROR,
+        ReturnCodes.SUCCESS,
+    ]
+    assert "b.ttl" in results[1][1]
+
+
+def test_check_json_wellformedness_parallel_jobs_reports_each_file(temp_dir: Path):
+    """JSON checks on the thread pool keep one ordered result per file."""
+    (temp_dir / "a.json").write_text('{"a": 1}')
+    (temp_dir / "b.json").write_text("{bad json}")
+
+    code, results = syntax_validator.check_json_wellformedness(
+        [temp_dir / "a.json", temp_dir / "b.json"], jobs=4
+    )
+    assert code == ReturnCodes.JSON_SYNTAX_ERROR
+    assert [c for c, _ in results] == [
+        ReturnCodes.SUCCESS,
+        ReturnCodes.JSON_SYNTAX_ERROR,
+    ]
+
+
+def test_iter_turtle_wellformedness_streams_until_closed(temp_dir: Path):
+    """The streaming API yields per-file results lazily, in input order."""
+    (temp_dir / "a.ttl").write_text("not turtle")
+    (temp_dir / "b.ttl").write_text("<http://ex.org/a> a <http://ex.org/B> .")
+
+    results = syntax_validator.iter_turtle_wellformedness(
+        [temp_dir / "a.ttl", temp_dir / "b.ttl"]
+    )
+    code, msg = next(results)
+    assert code == ReturnCodes.TURTLE_SYNTAX_ERROR
+    assert "a.ttl" in msg
+    results.close()
+
+
+def test_iter_json_wellformedness_no_files_yields_error():
+    results = list(syntax_validator.iter_json_wellformedness(["nonexistent_path"]))
+    assert results[0][0] == ReturnCodes.GENERAL_ERROR
+
+
+def test_iter_all_wellformedness_parallel_yields_json_then_turtle(temp_dir: Path):
+    """The fused queue walks paths once and reports JSON before Turtle."""
+    (temp_dir / "a.ttl").write_text("<http://ex.org/a> a <http://ex.org/B> .")
+    (temp_dir / "b.ttl").write_text("<http://ex.org/b> a <http://ex.org/B> .")
+    (temp_dir / "c.json").write_text('{"c": 1}')
+    (temp_dir / "d.json").write_text('{"d": 2}')
+
+    results = list(syntax_validator.iter_all_wellformedness(temp_dir, jobs=2))
+    assert [c for _, c, _ in results] == [ReturnCodes.SUCCESS] * 4
+    assert [fmt for fmt, _, _ in results] == ["json", "json", "turtle", "turtle"]
+    assert all(".json" in msg for _, _, msg in results[:2])
+    assert all(".ttl" in msg for _, _, msg in results[2:])
@@ -145,6 +145,21 @@ def test_check_environment_passes_in_venv():
     validation_suite.check_environment()
 
 
+def test_check_environment_outside_venv_raises_check_failure(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """check_environment() raises instead of exiting the interpreter."""
+    monkeypatch.setattr(
+        validation_suite.sys, "prefix", validation_suite.sys.base_prefix
+    )
+    monkeypatch.delenv("CONDA_DEFAULT_ENV", raising=False)
+    monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+
+    with pytest.raises(validation_suite.CheckFailure) as excinfo:
+        validation_suite.check_environment()
+    assert excinfo.value.return_code == 1
+
+
 # =============================================================================
 # Tests: check_syntax_all
 # =============================================================================
@@ -179,6 +194,28 @@ def test_check_syntax_all_domain_filter(repo_with_test_data: Path):
     assert result == 0  # Only test-domain is checked
 
 
+def test_check_syntax_all_parallel_jobs_passes(repo_with_test_data: Path):
+    """Fanning syntax checks out over worker processes gives the same result."""
+    resolver = RegistryResolver(repo_with_test_data)
+    result = validation_suite.check_syntax_all(
+        ["test-domain"], resolver=resolver, jobs=2
+    )
+    assert result == 0
+
+
+def test_check_syntax_all_parallel_jobs_reports_failure(repo_with_test_data: Path):
+    """A broken Turtle file still fails the check when run in parallel."""
+    shacl_file = (
+        repo_with_test_data / "artifacts" / "test-domain" / "test-domain.shacl.ttl"
+    )
+    shacl_file.write_text("not turtle")
+    resolver = RegistryResolver(repo_with_test_data)
+    result = validation_suite.check_syntax_all(
+        ["test-domain"], resolver=resolver, jobs=2
+    )
+    assert result == 102
+
+
 # =============================================================================
 # Tests: validate_data_conformance_all
 # =============================================================================